@@ -7,19 +7,48 @@ and backtests different configurations to find optimal settings through reverse
 
 Usage:
     python backtest_simulator.py [--db path/to/crasher_data.db]
+
+Installing numba (optional) runs the simulation through a compiled kernel.
+It is compiled on first import and cached next to this file; run
+scripts/warmup_numba.py to prime the cache ahead of time.
+Set BACKTEST_DB_PROVIDER=duckdb (requires duckdb) to scan the multipliers
+table with DuckDB instead of sqlite3.
 """
 
 import argparse
+import functools
 import itertools
 import json
+import math
+import multiprocessing
+import os
+import random
 import sqlite3
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
+from enum import IntFlag
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+try:
+    from numba import from_dtype, njit, types as nb_types
+except ImportError:  # numba is optional; BacktestEngine falls back to pure Python
+    njit = None
+
+try:
+    import duckdb
+except ImportError:  # duckdb is optional; load_sessions falls back to sqlite3
+    duckdb = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; exports fall back to json
+    orjson = None
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CONFIGURATION SPACE - Define parameter ranges to test
@@ -83,20 +112,45 @@ COLD_STREAK_LENGTH = 5
 HISTORY_SIZE = 50
 
 
-@dataclass
+@dataclass(slots=True)
 class HotstreakInfo:
     type: str  # "strong", "weak", or ""
     length: int = 0
     average: float = 0.0
     start_round: int = 0
-    multipliers: List[float] = field(default_factory=list)
+    multipliers: np.ndarray = field(default_factory=lambda: np.empty(0))
 
 
 class HotstreakTracker:
     """Detects hotstreaks and cold streaks in multiplier history."""
 
+    __slots__ = (
+        "_buf",
+        "_head",
+        "_count",
+        "_cum_mult",
+        "_cum_above2x",
+        "current_hotstreak",
+        "last_hotstreak",
+        "hotstreak_end_round",
+        "current_round",
+        "rounds_after_hotstreak",
+        "cold_streak_occurred",
+        "_cold_count",
+    )
+
     def __init__(self):
-        self.recent: List[float] = []
+        # Mirrored ring buffer of the last HISTORY_SIZE multipliers: every
+        # value is written at slot and slot + HISTORY_SIZE, so any trailing
+        # window is one contiguous slice.  _head counts every write, so the
+        # next slot is _head % HISTORY_SIZE.
+        self._buf = np.empty(2 * HISTORY_SIZE, dtype=np.float64)
+        self._head = 0
+        self._count = 0
+        # Prefix sums over every round seen (leading 0), so the sum and 2x+
+        # count of any trailing window are a single subtraction.
+        self._cum_mult: List[float] = [0.0]
+        self._cum_above2x: List[int] = [0]
         self.current_hotstreak: Optional[HotstreakInfo] = None
         self.last_hotstreak: Optional[HotstreakInfo] = None
         self.hotstreak_end_round = 0
@@ -106,15 +160,27 @@ class HotstreakTracker:
         self._cold_count = 0
 
     def add_multiplier(self, multiplier: float):
+        # Sessions hold float32; keep the prefix sums accumulating in float64
+        multiplier = float(multiplier)
         self.current_round += 1
-        self.recent.append(multiplier)
-        if len(self.recent) > HISTORY_SIZE:
-            self.recent.pop(0)
+        slot = self._head % HISTORY_SIZE
+        self._buf[slot] = self._buf[slot + HISTORY_SIZE] = multiplier
+        self._head += 1
+        if self._count < HISTORY_SIZE:
+            self._count += 1
+        self._cum_mult.append(self._cum_mult[-1] + multiplier)
+        self._cum_above2x.append(self._cum_above2x[-1] + (multiplier >= 2.0))
         self._detect_hotstreak()
         self._track_cold(multiplier)
 
-    def get_last_n(self, n: int) -> List[float]:
-        return self.recent[-n:] if len(self.recent) >= n else list(self.recent)
+    def get_last_n(self, n: int) -> np.ndarray:
+        """Last ``n`` multipliers, oldest first (fewer if not yet seen).
+
+        Always a view into the ring buffer, so callers that keep the result
+        must copy it.
+        """
+        end = self._head % HISTORY_SIZE + HISTORY_SIZE
+        return self._buf[end - min(n, self._count):end]
 
     def in_hotstreak(self) -> bool:
         return self.current_hotstreak is not None
@@ -124,27 +190,29 @@ class HotstreakTracker:
 
     def _detect_hotstreak(self):
         for ws in range(HOTSTREAK_MAX_WINDOW, HOTSTREAK_MIN_WINDOW - 1, -1):
-            if len(self.recent) < ws:
+            if self._count < ws:
                 continue
-            window = self.recent[-ws:]
-            above = sum(1 for m in window if m >= 2.0)
+            above = self._cum_above2x[-1] - self._cum_above2x[-1 - ws]
             pct = above / ws
             if pct >= HOTSTREAK_WEAK_PCT:
-                avg = sum(window) / ws
+                avg = (self._cum_mult[-1] - self._cum_mult[-1 - ws]) / ws
                 stype = "strong" if pct >= HOTSTREAK_STRONG_PCT else "weak"
+                # A view into the ring buffer; it is replaced every round
+                # while the streak lasts and copied out when it ends.
+                window = self.get_last_n(ws)
                 if self.current_hotstreak is None:
                     self.current_hotstreak = HotstreakInfo(
                         type=stype,
                         length=ws,
                         average=avg,
                         start_round=self.current_round - ws + 1,
-                        multipliers=window.copy(),
+                        multipliers=window,
                     )
                 else:
                     self.current_hotstreak.type = stype
                     self.current_hotstreak.length = ws
                     self.current_hotstreak.average = avg
-                    self.current_hotstreak.multipliers = window.copy()
+                    self.current_hotstreak.multipliers = window
                 return
 
         if self.current_hotstreak is not None:
@@ -172,50 +240,248 @@ class HotstreakTracker:
             self._cold_count = 0
 
 
+class Signal(IntFlag):
+    """Signal kinds, as bits in a per-round SignalTimeline mask."""
+
+    STRONG_HOTSTREAK = 1 << 0
+    WEAK_HOTSTREAK = 1 << 1
+    PRE_STREAK = 1 << 2
+    HIGH_STDDEV_10 = 1 << 3
+    HIGH_STDDEV_15 = 1 << 4
+    POSSIBLE_CHAIN = 1 << 5
+    DEAD_ASS_CHAIN = 1 << 6
+    RULE_OF_17 = 1 << 7
+
+
+# Plain-int copies for the per-round loops and the compiled kernel, where
+# IntFlag arithmetic would build a new enum member on every operation
+SIG_STRONG_HOTSTREAK = int(Signal.STRONG_HOTSTREAK)
+SIG_WEAK_HOTSTREAK = int(Signal.WEAK_HOTSTREAK)
+SIG_PRE_STREAK = int(Signal.PRE_STREAK)
+SIG_HIGH_STDDEV_10 = int(Signal.HIGH_STDDEV_10)
+SIG_HIGH_STDDEV_15 = int(Signal.HIGH_STDDEV_15)
+SIG_POSSIBLE_CHAIN = int(Signal.POSSIBLE_CHAIN)
+SIG_DEAD_ASS_CHAIN = int(Signal.DEAD_ASS_CHAIN)
+SIG_RULE_OF_17 = int(Signal.RULE_OF_17)
+HOTSTREAK_SIGNALS = SIG_STRONG_HOTSTREAK | SIG_WEAK_HOTSTREAK
+
+# Non-hotstreak signals in the order the engine reports them
+SIGNAL_NAMES = (
+    (SIG_PRE_STREAK, "pre_streak"),
+    (SIG_HIGH_STDDEV_10, "high_stddev_w10"),
+    (SIG_HIGH_STDDEV_15, "high_stddev_w15"),
+    (SIG_POSSIBLE_CHAIN, "possible_chain"),
+    (SIG_DEAD_ASS_CHAIN, "dead_ass_chain"),
+    (SIG_RULE_OF_17, "rule_of_17"),
+)
+_HIGH_STDDEV_BITS = {10: SIG_HIGH_STDDEV_10, 15: SIG_HIGH_STDDEV_15}
+SIGNAL_WINDOWS = tuple(_HIGH_STDDEV_BITS)
+# Sessions shorter than this cannot fire any signal: hotstreaks and pattern
+# windows need that many rounds, and chains need a hotstreak first
+MIN_SIGNAL_ROUNDS = min(HOTSTREAK_MIN_WINDOW, *SIGNAL_WINDOWS)
+
+
 def analyze_window(window: List[float], window_size: int) -> List[str]:
     """Analyze a multiplier window and return list of detected signal names."""
     signals = []
     if len(window) < window_size:
         return signals
 
+    window = np.asarray(window)
     avg = np.mean(window)
     std = np.std(window)
     mx = np.max(window)
-    above_2x = sum(1 for m in window if m >= 2.0)
+    above_2x = np.count_nonzero(window >= 2.0)
 
-    if window_size == 10 and avg > 3.75 and above_2x >= 4 and std > 12 and mx > 7.16:
-        signals.append("pre_streak")
+    return _window_signals(avg, std, mx, above_2x, window_size)
 
-    if std > 25:
-        signals.append("high_stddev")
 
+def _window_signals(
+    avg: float, std: float, mx: float, above_2x: int, window_size: int
+) -> List[str]:
+    bits = _window_bits(avg, std, mx, above_2x, window_size)
+    return window_signal_names(bits, window_size)
+
+
+def window_signal_names(bits: int, window_size: int) -> List[str]:
+    """analyze_window's signal names for one window's SIG_* bits."""
+    signals = []
+    if bits & SIG_PRE_STREAK:
+        signals.append("pre_streak")
+    if bits & _HIGH_STDDEV_BITS[window_size]:
+        signals.append("high_stddev")
     return signals
 
 
+def _window_bits(avg, std, mx, above_2x, window_size: int):
+    """SIG_* bits for window stats; works on scalars or whole stat arrays."""
+    pre_streak = (
+        (window_size == 10) & (avg > 3.75) & (above_2x >= 4) & (std > 12) & (mx > 7.16)
+    )
+    return pre_streak * SIG_PRE_STREAK | (std > 25) * _HIGH_STDDEV_BITS[window_size]
+
+
+def precompute_window_stats(multipliers, dtype=np.float32) -> Dict[str, np.ndarray]:
+    """Rolling mean/std/max/2x+ count for every full 10- and 15-round window.
+
+    Keys are ``mean10``, ``std10``, ``max10``, ``above10`` and the same for 15.
+    Entry ``j`` describes ``multipliers[j : j + size]``, the window that ends
+    at round ``j + size``.  Windows are read as ``dtype`` (float32, like the
+    session arrays, by default); the reductions accumulate in float64.
+    """
+    mults = np.asarray(multipliers, dtype=dtype)
+    # 2x+ counts are integers, so prefix-sum differences are exact
+    above_cum = np.concatenate(([0], np.cumsum(mults >= 2.0)))
+    stats = {}
+    for size in SIGNAL_WINDOWS:
+        if len(mults) < size:
+            win = np.empty((0, size), dtype=mults.dtype)
+        else:
+            win = sliding_window_view(mults, size)
+        mean = win.mean(axis=1, dtype=np.float64)
+        # np.std's own steps, reusing the mean instead of summing again
+        dev = win - mean[:, None]
+        stats[f"mean{size}"] = mean
+        stats[f"std{size}"] = np.sqrt(np.square(dev).sum(axis=1) / size)
+        stats[f"max{size}"] = win.max(axis=1, initial=-np.inf)
+        stats[f"above{size}"] = above_cum[size:] - above_cum[: len(win)]
+    return stats
+
+
+def window_signal_masks(stats: Dict[str, np.ndarray], n_rounds: int) -> np.ndarray:
+    """SIG_* window bits after every round, from ``precompute_window_stats``."""
+    bits = np.zeros(n_rounds, dtype=np.uint16)
+    for size in SIGNAL_WINDOWS:
+        if n_rounds < size:
+            continue
+        bits[size - 1 :] |= window_stat_bits(stats, size).astype(np.uint16)
+    return bits
+
+
+def window_stat_bits(stats: Dict[str, np.ndarray], size: int) -> np.ndarray:
+    """SIG_* bits of every full ``size``-round window in precompute_window_stats."""
+    return _window_bits(
+        stats[f"mean{size}"],
+        stats[f"std{size}"],
+        stats[f"max{size}"],
+        stats[f"above{size}"],
+        size,
+    )
+
+
 def check_chain_patterns(tracker: HotstreakTracker) -> List[str]:
     """Check chain patterns after hotstreak ends."""
+    bits = chain_pattern_mask(tracker)
+    return [name for bit, name in SIGNAL_NAMES if bits & bit]
+
+
+def chain_pattern_mask(tracker: HotstreakTracker) -> int:
+    """check_chain_patterns as SIG_* bits."""
     if tracker.last_hotstreak is None:
-        return []
+        return 0
 
-    signals = []
+    bits = 0
     ra = tracker.rounds_after_hotstreak
 
     if ra == 10:
         last_10 = tracker.get_last_n(10)
         if len(last_10) == 10:
             avg = np.mean(last_10)
-            above = sum(1 for m in last_10 if m >= 2.0)
+            above = np.count_nonzero(last_10 >= 2.0)
             if avg > 2.0 and above > 4 and not tracker.cold_streak_occurred:
                 ls = tracker.last_hotstreak
                 if ls.type == "strong" and ls.average > 6.0:
-                    signals.append("dead_ass_chain")
+                    bits |= SIG_DEAD_ASS_CHAIN
                 else:
-                    signals.append("possible_chain")
+                    bits |= SIG_POSSIBLE_CHAIN
 
     if ra == 15 and not tracker.cold_streak_occurred:
-        signals.append("rule_of_17")
+        bits |= SIG_RULE_OF_17
+
+    return bits
 
-    return signals
+
+@dataclass(slots=True)
+class SignalTimeline:
+    """Signals seen after each round of a session, independent of any config.
+
+    ``mask[i]`` ORs the SIG_* bits detected once round ``i + 1`` was added.
+    """
+
+    mask: np.ndarray
+
+
+def sweep_hotstreaks(multipliers) -> Dict[str, np.ndarray]:
+    """HotstreakTracker and chain_pattern_mask over a whole session at once.
+
+    Entry ``i`` of each array is the tracker state after round ``i + 1``:
+    ``type`` (0 none, 1 weak, 2 strong), ``length`` and ``average`` of the
+    current hotstreak, and ``chain``, the chain-pattern SIG_* bits.
+
+    Detection only looks at the trailing 10-15 rounds, so it is evaluated
+    for every round from prefix sums.  The post-hotstreak state (rounds since
+    the last streak ended, whether a cold streak followed) comes from
+    running maxima over the rounds where a streak ended.
+    """
+    m = np.asarray(multipliers, dtype=np.float64)
+    n = len(m)
+    hot = m >= 2.0
+    # Same sequential sums as the tracker's prefix lists
+    cum_mult = np.concatenate(([0.0], np.cumsum(m)))
+    cum_hot = np.concatenate(([0], np.cumsum(hot)))
+
+    hs_type = np.zeros(n, dtype=np.int8)
+    hs_len = np.zeros(n, dtype=np.int8)
+    hs_avg = np.zeros(n)
+    # The tracker takes the largest qualifying window, so larger ones win
+    for ws in range(HOTSTREAK_MIN_WINDOW, HOTSTREAK_MAX_WINDOW + 1):
+        end = np.arange(ws, n + 1)
+        pct = (cum_hot[end] - cum_hot[end - ws]) / ws
+        hit = pct >= HOTSTREAK_WEAK_PCT
+        idx = end[hit] - 1
+        hs_len[idx] = ws
+        hs_type[idx] = np.where(pct[hit] >= HOTSTREAK_STRONG_PCT, 2, 1)
+        hs_avg[idx] = (cum_mult[end[hit]] - cum_mult[end[hit] - ws]) / ws
+
+    # Rounds where a hotstreak ended; last_end is the latest one so far
+    rounds = np.arange(n)
+    ended = np.zeros(n, dtype=bool)
+    ended[1:] = (hs_type[1:] == 0) & (hs_type[:-1] != 0)
+    last_end = np.maximum.accumulate(np.where(ended, rounds, -1))
+    rounds_after = rounds - last_end + 1
+
+    # Cold streaks only count from the round a hotstreak ended
+    last_warm = np.maximum.accumulate(np.where(hot, rounds, -1))
+    cold_run = rounds - np.maximum(last_warm, last_end - 1)
+    cold_hit = (last_end >= 0) & (cold_run >= COLD_STREAK_LENGTH)
+    cold_seen = np.maximum.accumulate(np.where(cold_hit, rounds, -1)) >= last_end
+
+    chain = np.zeros(n, dtype=np.uint16)
+    live = (last_end >= 0) & ~cold_seen
+    for i in np.flatnonzero(live & (rounds_after == 10)):
+        last_10 = m[i - 9 : i + 1]
+        if np.mean(last_10) > 2.0 and np.count_nonzero(last_10 >= 2.0) > 4:
+            prev = last_end[i] - 1
+            if hs_type[prev] == 2 and hs_avg[prev] > 6.0:
+                chain[i] |= SIG_DEAD_ASS_CHAIN
+            else:
+                chain[i] |= SIG_POSSIBLE_CHAIN
+    chain[live & (rounds_after == 15)] |= SIG_RULE_OF_17
+
+    return {"type": hs_type, "length": hs_len, "average": hs_avg, "chain": chain}
+
+
+def precompute_signals(session: "SessionData") -> SignalTimeline:
+    """Run hotstreak, window and chain detection over a session once."""
+    n_rounds = len(session.multipliers)
+    if n_rounds < MIN_SIGNAL_ROUNDS:
+        return SignalTimeline(mask=np.zeros(n_rounds, dtype=np.uint16))
+    sweep = sweep_hotstreaks(session.multipliers)
+    mask = window_signal_masks(session.window_stats(), len(session.multipliers))
+    mask[sweep["type"] == 1] |= SIG_WEAK_HOTSTREAK
+    mask[sweep["type"] == 2] |= SIG_STRONG_HOTSTREAK
+    mask |= sweep["chain"]
+    return SignalTimeline(mask=mask)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -223,8 +489,10 @@ def check_chain_patterns(tracker: HotstreakTracker) -> List[str]:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
-@dataclass
-class CustomConfig:
+class CustomConfig(NamedTuple):
+    """One strategy configuration; a plain tuple, so it is cheap to build,
+    hash and pickle by the thousand during a grid search."""
+
     base_bet: float = 1000
     auto_cashout: float = 2.0
     max_consecutive_losses: int = 10
@@ -248,12 +516,65 @@ class CustomConfig:
     signal_confirm_window: int = 5
     signal_monitor_rounds: int = 20
 
+    def to_record(self) -> np.ndarray:
+        """Pack the config into a 1-element CONFIG_DTYPE array."""
+        return np.array([tuple(self)], dtype=CONFIG_DTYPE)
+
+    def activation_mask(self) -> int:
+        """SIG_* bits this config acts on (dead_ass_chain never activates)."""
+        mask = 0
+        if self.activate_on_strong_hotstreak:
+            mask |= SIG_STRONG_HOTSTREAK
+        if self.activate_on_weak_hotstreak:
+            mask |= SIG_WEAK_HOTSTREAK
+        if self.activate_on_rule_of_17:
+            mask |= SIG_RULE_OF_17
+        if self.activate_on_pre_streak_pattern:
+            mask |= SIG_PRE_STREAK
+        if self.activate_on_possible_chain:
+            mask |= SIG_POSSIBLE_CHAIN
+        if self.activate_on_high_deviation_10:
+            mask |= SIG_HIGH_STDDEV_10
+        if self.activate_on_high_deviation_15:
+            mask |= SIG_HIGH_STDDEV_15
+        return mask
+
+
+# Field-for-field mirror of CustomConfig, in the same order, read by the
+# compiled kernel
+CONFIG_DTYPE = np.dtype(
+    [
+        ("base_bet", "f8"),
+        ("auto_cashout", "f8"),
+        ("max_consecutive_losses", "i8"),
+        ("max_losses_in_window", "i8"),
+        ("loss_check_window", "i8"),
+        ("bet_multiplier", "f8"),
+        ("stop_profit_count", "i8"),
+        ("cooldown_after_win", "i8"),
+        ("cooldown_after_loss", "i8"),
+        ("activate_on_strong_hotstreak", "?"),
+        ("activate_on_weak_hotstreak", "?"),
+        ("activate_on_rule_of_17", "?"),
+        ("activate_on_pre_streak_pattern", "?"),
+        ("activate_on_possible_chain", "?"),
+        ("activate_on_high_deviation_10", "?"),
+        ("activate_on_high_deviation_15", "?"),
+        ("signal_confirm_threshold", "f8"),
+        ("signal_confirm_count", "i8"),
+        ("signal_confirm_window", "i8"),
+        ("signal_monitor_rounds", "i8"),
+    ]
+)
+
 
-@dataclass
+@dataclass(slots=True)
 class SimulationState:
     """Tracks state during backtesting simulation."""
 
     config: CustomConfig
+    # Keep the per-signal and per-bet logs; counters are always kept
+    record_details: bool = False
 
     # Betting state
     current_bet: float = 0.0
@@ -282,14 +603,31 @@ class SimulationState:
     max_win_streak: int = 0
     loss_streak: int = 0
     max_loss_streak: int = 0
+    n_signals: int = 0
+    total_wagered: float = 0.0
     signals_fired: List[Tuple[int, str]] = field(default_factory=list)
     bets_placed: List[Tuple[int, float, float, str]] = field(
         default_factory=list
     )  # (round, bet, mult, outcome)
 
+    # Stake after k consecutive losses, indexed by k
+    _bet_table: Tuple[float, ...] = field(init=False, repr=False)
+    # Cashout and confirm thresholds in the rounds' float32, as the kernel
+    # compares them; a Python float would promote the compare to float64
+    # under NumPy 1.x
+    _cashout_at: np.float32 = field(init=False, repr=False)
+    _confirm_at: np.float32 = field(init=False, repr=False)
+
     def __post_init__(self):
         if self.current_bet == 0.0:
             self.current_bet = self.config.base_bet
+        self._cashout_at = np.float32(self.config.auto_cashout)
+        self._confirm_at = np.float32(self.config.signal_confirm_threshold)
+        base, mult = self.config.base_bet, self.config.bet_multiplier
+        self._bet_table = (base,) + tuple(
+            base * mult**k
+            for k in range(1, max(self.config.max_consecutive_losses, 0) + 2)
+        )
 
     def reset(self):
         self.current_bet = self.config.base_bet
@@ -316,7 +654,7 @@ class SimulationState:
     def start_monitoring(self, reason: str, initial: Optional[List[float]] = None):
         self.monitoring = True
         self.rounds_monitored = 0
-        self.monitoring_history = list(initial) if initial else []
+        self.monitoring_history = list(initial) if initial is not None else []
         self.pending_signal_reason = reason
 
     def stop_monitoring(self):
@@ -363,41 +701,24 @@ class SimulationState:
             and self.total_wins >= self.config.stop_profit_count
         )
 
-    def next_bet(self) -> float:
-        if self.consecutive_losses == 0:
-            return self.config.base_bet
-        return self.config.base_bet * (
-            self.config.bet_multiplier**self.consecutive_losses
-        )
+    def record_signal(self, round_num: int, reason: str):
+        self.n_signals += 1
+        if self.record_details:
+            self.signals_fired.append((round_num, reason))
 
-    def should_activate_on_signal(self, signal_name: str) -> bool:
-        mapping = {
-            "pre_streak": self.config.activate_on_pre_streak_pattern,
-            "rule_of_17": self.config.activate_on_rule_of_17,
-            "possible_chain": self.config.activate_on_possible_chain,
-            "dead_ass_chain": False,
-        }
-        return bool(mapping.get(signal_name, False))
-
-    def should_activate_on_high_stddev(self, window_size: int) -> bool:
-        if window_size == 10:
-            return self.config.activate_on_high_deviation_10
-        elif window_size == 15:
-            return self.config.activate_on_high_deviation_15
-        return False
-
-    def should_activate_on_hotstreak(self, hotstreak_type: str) -> bool:
-        if hotstreak_type == "strong":
-            return self.config.activate_on_strong_hotstreak
-        elif hotstreak_type == "weak":
-            return self.config.activate_on_weak_hotstreak
-        return False
+    def record_bet(self, round_num: int, bet: float, mult: float, outcome: str):
+        self.total_wagered += bet
+        if self.record_details:
+            self.bets_placed.append((round_num, bet, mult, outcome))
+
+    def next_bet(self) -> float:
+        return self._bet_table[self.consecutive_losses]
 
     def check_confirmation(self, recent_mults: List[float]) -> bool:
         if len(recent_mults) < self.config.signal_confirm_window:
             return False
-        window = recent_mults[-self.config.signal_confirm_window :]
-        above = sum(1 for m in window if m >= self.config.signal_confirm_threshold)
+        window = np.asarray(recent_mults[-self.config.signal_confirm_window :])
+        above = np.count_nonzero(window >= self._confirm_at)
         return above >= self.config.signal_confirm_count
 
     def update_stats(self, profit: float):
@@ -409,20 +730,292 @@ class SimulationState:
             self.max_drawdown = drawdown
 
 
+# ═══════════════════════════════════════════════════════════════════════════════
+# COMPILED SIMULATION KERNEL (mirrors BacktestEngine's per-round loop)
+# ═══════════════════════════════════════════════════════════════════════════════
+
+def _simulate_sessions(mults, signal_mask, offsets, cfg, activation, profits):
+    """Run one config over every session and return the aggregate metrics.
+
+    ``mults`` and ``signal_mask`` hold all sessions back to back, split by
+    ``offsets``; the mask comes from precompute_signals and ``activation`` from
+    CustomConfig.activation_mask.  ``cfg`` is a CustomConfig.to_record() row.
+    Per-bet profits are written to ``profits`` for the Sharpe calculation.
+    The control flow follows BacktestEngine.run and SimulationState step for
+    step.  Bets are only ever opened while idle, when consecutive_losses is 0,
+    so they start at base_bet.
+
+    Confirmation counts come from a per-session prefix sum of rounds at or
+    above the confirm threshold.  The monitoring history is always the
+    session's trailing rounds, so it reads the same prefix counts.
+    """
+    base_bet = cfg.base_bet
+    auto_cashout = cfg.auto_cashout
+    max_consecutive_losses = cfg.max_consecutive_losses
+    max_losses_in_window = cfg.max_losses_in_window
+    loss_check_window = cfg.loss_check_window
+    bet_multiplier = cfg.bet_multiplier
+    stop_profit_count = cfg.stop_profit_count
+    cooldown_after_win = cfg.cooldown_after_win
+    cooldown_after_loss = cfg.cooldown_after_loss
+    confirm_threshold = cfg.signal_confirm_threshold
+    confirm_count = cfg.signal_confirm_count
+    confirm_window = cfg.signal_confirm_window
+    monitor_rounds = cfg.signal_monitor_rounds
+    # Rounds are float32; compare them against the thresholds in float32, as
+    # the Python path does, while payouts still use the float64 cashout
+    cashout_at = np.float32(auto_cashout)
+    confirm_at = np.float32(confirm_threshold)
+
+    max_len = 0
+    for s in range(offsets.shape[0] - 1):
+        max_len = max(max_len, offsets[s + 1] - offsets[s])
+    cum_confirm = np.zeros(max_len + 1, dtype=np.int64)
+    outcomes = np.zeros(max(loss_check_window, 1), dtype=np.int64)
+    # Martingale stake after k consecutive losses
+    bet_table = np.empty(max(max_consecutive_losses, 0) + 2)
+    for k in range(bet_table.shape[0]):
+        bet_table[k] = base_bet * (bet_multiplier ** float(k))
+
+    # Totals carried across sessions
+    total_profit = 0.0
+    peak_profit = 0.0
+    max_drawdown = 0.0
+    total_wins = 0
+    total_bets = 0
+    win_streak = 0
+    loss_streak = 0
+    max_win_streak = 0
+    max_loss_streak = 0
+    signals_fired = 0
+    n_profits = 0
+    total_wagered = 0.0
+    gross_profit = 0.0
+    gross_loss = 0.0
+    # recent_outcomes survives session boundaries, like SimulationState
+    n_outcomes = 0
+    outcome_head = 0
+    window_losses = 0
+
+    for s in range(offsets.shape[0] - 1):
+        r = 0  # rounds seen this session
+
+        # state.reset() + stop_monitoring() + cooldown cleared
+        current_bet = base_bet
+        consecutive_losses = 0
+        waiting = False
+        active = False
+        monitoring = False
+        rounds_monitored = 0
+        cooldown = 0
+
+        for i in range(offsets[s], offsets[s + 1]):
+            mult = mults[i]
+            seen = signal_mask[i]
+            signals = seen & activation
+            r += 1
+            cum_confirm[r] = cum_confirm[r - 1] + (
+                1 if mult >= confirm_at else 0
+            )
+
+            # ── cooldown tick ──
+            if cooldown > 0:
+                cooldown -= 1
+
+            # ── active bet result ──
+            if waiting:
+                bet_amount = current_bet
+                total_bets += 1
+                if mult >= cashout_at:
+                    profit = bet_amount * (auto_cashout - 1)
+                    total_wins += 1
+                    outcome = 0
+                else:
+                    profit = -bet_amount
+                    outcome = 1
+
+                if loss_check_window > 0:
+                    if n_outcomes == loss_check_window:
+                        window_losses -= outcomes[outcome_head]
+                    else:
+                        n_outcomes += 1
+                    outcomes[outcome_head] = outcome
+                    window_losses += outcome
+                    outcome_head = (outcome_head + 1) % loss_check_window
+
+                total_profit += profit
+                if total_profit > peak_profit:
+                    peak_profit = total_profit
+                if peak_profit - total_profit > max_drawdown:
+                    max_drawdown = peak_profit - total_profit
+
+                stop = False
+                if outcome == 0:
+                    win_streak += 1
+                    loss_streak = 0
+                    if win_streak > max_win_streak:
+                        max_win_streak = win_streak
+                    consecutive_losses = 0
+                    current_bet = base_bet
+                    waiting = False
+                    if stop_profit_count > 0 and total_wins >= stop_profit_count:
+                        stop = True
+                        if cooldown_after_win > 0:
+                            total_wins = 0
+                            cooldown = cooldown_after_win
+                    else:
+                        active = True
+                        current_bet = base_bet
+                        waiting = True
+                else:
+                    loss_streak += 1
+                    win_streak = 0
+                    if loss_streak > max_loss_streak:
+                        max_loss_streak = loss_streak
+                    consecutive_losses += 1
+                    if consecutive_losses >= max_consecutive_losses or (
+                        n_outcomes >= loss_check_window
+                        and window_losses >= max_losses_in_window
+                    ):
+                        stop = True
+                        if cooldown_after_loss > 0:
+                            cooldown = cooldown_after_loss
+                    else:
+                        current_bet = bet_table[consecutive_losses]
+                        waiting = True
+
+                if stop:
+                    # enter_cooldown_reset() or full_reset()
+                    if cooldown == 0:
+                        total_wins = 0
+                    current_bet = base_bet
+                    consecutive_losses = 0
+                    waiting = False
+                    active = False
+                    n_outcomes = 0
+                    outcome_head = 0
+                    window_losses = 0
+                    monitoring = False
+                    rounds_monitored = 0
+
+                profits[n_profits] = profit
+                n_profits += 1
+                total_wagered += bet_amount
+                if profit > 0:
+                    gross_profit += profit
+                else:
+                    gross_loss += abs(profit)
+
+            # ── signal monitoring ──
+            if monitoring and not active and cooldown == 0:
+                rounds_monitored += 1
+                if (
+                    r >= confirm_window
+                    and cum_confirm[r] - cum_confirm[r - confirm_window]
+                    >= confirm_count
+                ):
+                    signals_fired += 1
+                    monitoring = False
+                    rounds_monitored = 0
+                    active = True
+                    current_bet = base_bet
+                    waiting = True
+                elif rounds_monitored >= monitor_rounds:
+                    monitoring = False
+                    rounds_monitored = 0
+
+            # ── hotstreak activation ──
+            if (
+                cooldown == 0
+                and not active
+                and not waiting
+                and signals & HOTSTREAK_SIGNALS
+            ):
+                signals_fired += 1
+                monitoring = False
+                rounds_monitored = 0
+                active = True
+                current_bet = base_bet
+                waiting = True
+
+            # ── signal analysis ──
+            if (
+                active
+                or waiting
+                or cooldown > 0
+                or seen & HOTSTREAK_SIGNALS
+                or not signals
+            ):
+                continue
+
+            # ── _signal_triggered: immediate confirmation or start monitoring ──
+            if (
+                r >= confirm_window
+                and cum_confirm[r] - cum_confirm[r - confirm_window] >= confirm_count
+            ):
+                signals_fired += 1
+                active = True
+                current_bet = base_bet
+                waiting = True
+            else:
+                monitoring = True
+                rounds_monitored = 0
+
+    return (
+        n_profits,
+        total_profit,
+        total_bets,
+        total_wins,
+        max_drawdown,
+        max_win_streak,
+        max_loss_streak,
+        signals_fired,
+        total_wagered,
+        gross_profit,
+        gross_loss,
+    )
+
+
+# An explicit signature compiles the kernel at import (or loads it from the
+# on-disk cache) instead of on the first run() call.
+_simulate_sessions_nb = (
+    njit(
+        (
+            nb_types.float32[::1],
+            nb_types.uint16[::1],
+            nb_types.int64[::1],
+            from_dtype(CONFIG_DTYPE),
+            nb_types.int64,
+            nb_types.float64[::1],
+        ),
+        cache=True,
+    )(_simulate_sessions)
+    if njit
+    else None
+)
+
+
 # ═══════════════════════════════════════════════════════════════════════════════
 # BACKTESTING ENGINE
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionData:
     session_id: int
-    multipliers: List[float]
+    multipliers: np.ndarray
     start_time: str
     end_time: Optional[str]
+    precomputed: Dict[str, np.ndarray] = field(default_factory=dict, repr=False)
+
+    def window_stats(self) -> Dict[str, np.ndarray]:
+        """Rolling window stats, computed on first use and shared by all configs."""
+        if not self.precomputed:
+            self.precomputed = precompute_window_stats(self.multipliers)
+        return self.precomputed
 
 
-@dataclass
+@dataclass(slots=True)
 class BacktestResult:
     config: CustomConfig
     total_profit: float
@@ -437,6 +1030,11 @@ class BacktestResult:
     signals_fired: int
     avg_bet_size: float
     roi: float  # Return on investment (profit / total wagered)
+    # Filled only when BacktestEngine.record_details is set
+    signal_log: List[Tuple[int, str]] = field(default_factory=list, repr=False)
+    bet_log: List[Tuple[int, float, float, str]] = field(
+        default_factory=list, repr=False
+    )
 
     def score(self) -> float:
         """Combined score for ranking configs."""
@@ -457,19 +1055,45 @@ class BacktestEngine:
 
     def __init__(self, sessions: List[SessionData]):
         self.sessions = sessions
-        self.verbose = False
+        # Keep per-signal and per-bet logs on each result (Python path only)
+        self.record_details = False
+
+        # Signal detection does not depend on the config, so it runs once
+        # per session here and every run() reuses it.
+        self._timelines: Dict[int, SignalTimeline] = {
+            s.session_id: precompute_signals(s) for s in sessions
+        }
+
+        # Flattened multipliers and signal masks for the compiled kernel
+        lengths = [len(s.multipliers) for s in sessions]
+        self._offsets = np.zeros(len(sessions) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=self._offsets[1:])
+        self._mults = np.empty(self._offsets[-1], dtype=np.float32)
+        self._signal_mask = np.empty(self._offsets[-1], dtype=np.uint16)
+        for s, start in zip(sessions, self._offsets):
+            end = start + len(s.multipliers)
+            self._mults[start:end] = s.multipliers
+            self._signal_mask[start:end] = self._timelines[s.session_id].mask
 
     def run(self, config: CustomConfig) -> BacktestResult:
-        """Run backtest with the given configuration."""
+        """Run backtest with the given configuration.
+
+        Uses the compiled kernel when numba is available; with record_details
+        set, runs take the Python path so the signal and bet logs are kept.
+        """
+        if _simulate_sessions_nb is not None and not self.record_details:
+            return self._run_compiled(config)
+
         all_profits = []
-        total_wagered = 0.0
         gross_profit = 0.0
         gross_loss = 0.0
 
-        state = SimulationState(config=config)
+        state = SimulationState(config=config, record_details=self.record_details)
+        activation = config.activation_mask()
 
         for session in self.sessions:
-            tracker = HotstreakTracker()
+            mults = session.multipliers
+            timeline = self._timelines[session.session_id]
 
             # Reset state between sessions (simulate fresh start)
             # But keep cumulative stats
@@ -477,9 +1101,25 @@ class BacktestEngine:
             state.stop_monitoring()
             state.cooldown_remaining = 0
 
-            for i, mult in enumerate(session.multipliers):
+            i = 0
+            run_rounds = 0
+            while i < len(mults):
+                # Settle the rest of a long betting run in bulk
+                if state.waiting_for_result and run_rounds >= FAST_FORWARD_MIN_RUN:
+                    run_rounds = 0
+                    i, profits = self._fast_forward_bets(state, mults, i)
+                    if len(profits):
+                        all_profits.extend(profits.tolist())
+                        won = profits > 0
+                        gross_profit = _running_sum(gross_profit, profits[won])
+                        gross_loss = _running_sum(gross_loss, -profits[~won])
+                    if i == len(mults):
+                        break
+
+                mult = mults[i]
                 round_num = i + 1
-                tracker.add_multiplier(mult)
+                signals = int(timeline.mask[i]) & activation
+                i += 1
 
                 # Tick cooldown each round
                 if state.in_cooldown():
@@ -488,10 +1128,8 @@ class BacktestEngine:
                 # Handle active bet result
                 if state.waiting_for_result:
                     profit = self._handle_result(state, mult, round_num)
+                    run_rounds = run_rounds + 1 if state.waiting_for_result else 0
                     all_profits.append(profit)
-                    total_wagered += (
-                        state.bets_placed[-1][1] if state.bets_placed else 0
-                    )
                     if profit > 0:
                         gross_profit += profit
                     else:
@@ -499,11 +1137,11 @@ class BacktestEngine:
 
                 # Signal monitoring (if not in cooldown)
                 if state.monitoring and not state.is_active and not state.in_cooldown():
-                    self._monitor_round(state, mult, tracker, round_num)
+                    self._monitor_round(state, mult, round_num)
 
                 # Hotstreak activation (if not in cooldown)
                 if not state.in_cooldown():
-                    self._check_hotstreak_activation(state, tracker, round_num)
+                    self._check_hotstreak_activation(state, signals, round_num)
 
                 # Signal analysis (if idle)
                 if (
@@ -511,11 +1149,85 @@ class BacktestEngine:
                     and not state.waiting_for_result
                     and not state.in_cooldown()
                 ):
-                    self._analyze_signals(state, tracker, round_num)
+                    in_hotstreak = timeline.mask[i - 1] & HOTSTREAK_SIGNALS
+                    if not in_hotstreak:
+                        self._analyze_signals(
+                            state, mults, i - 1, signals, round_num
+                        )
+
+        result = self._summarize(
+            config,
+            all_profits,
+            total_profit=state.total_profit,
+            total_bets=state.total_bets,
+            total_wins=state.total_wins,
+            max_drawdown=state.max_drawdown,
+            max_win_streak=state.max_win_streak,
+            max_loss_streak=state.max_loss_streak,
+            signals_fired=state.n_signals,
+            total_wagered=state.total_wagered,
+            gross_profit=gross_profit,
+            gross_loss=gross_loss,
+        )
+        if self.record_details:
+            result.signal_log = state.signals_fired
+            result.bet_log = state.bets_placed
+        return result
+
+    def _run_compiled(self, config: CustomConfig) -> BacktestResult:
+        """Run the backtest through the numba kernel."""
+        profits = np.empty(len(self._mults), dtype=np.float64)
+        (
+            n_profits,
+            total_profit,
+            total_bets,
+            total_wins,
+            max_drawdown,
+            max_win_streak,
+            max_loss_streak,
+            signals_fired,
+            total_wagered,
+            gross_profit,
+            gross_loss,
+        ) = _simulate_sessions_nb(
+            self._mults,
+            self._signal_mask,
+            self._offsets,
+            config.to_record()[0],
+            config.activation_mask(),
+            profits,
+        )
+        return self._summarize(
+            config,
+            profits[:n_profits],
+            total_profit=total_profit,
+            total_bets=total_bets,
+            total_wins=total_wins,
+            max_drawdown=max_drawdown,
+            max_win_streak=max_win_streak,
+            max_loss_streak=max_loss_streak,
+            signals_fired=signals_fired,
+            total_wagered=total_wagered,
+            gross_profit=gross_profit,
+            gross_loss=gross_loss,
+        )
 
-        # Calculate metrics
-        total_wins = state.total_wins
-        total_bets = state.total_bets
+    @staticmethod
+    def _summarize(
+        config: CustomConfig,
+        all_profits,
+        total_profit: float,
+        total_bets: int,
+        total_wins: int,
+        max_drawdown: float,
+        max_win_streak: int,
+        max_loss_streak: int,
+        signals_fired: int,
+        total_wagered: float,
+        gross_profit: float,
+        gross_loss: float,
+    ) -> BacktestResult:
+        """Turn raw simulation totals into a BacktestResult."""
         win_rate = total_wins / total_bets if total_bets > 0 else 0.0
         profit_factor = (
             gross_profit / gross_loss
@@ -532,21 +1244,21 @@ class BacktestEngine:
         else:
             sharpe = 0.0
 
-        roi = state.total_profit / total_wagered if total_wagered > 0 else 0.0
+        roi = total_profit / total_wagered if total_wagered > 0 else 0.0
         avg_bet = total_wagered / total_bets if total_bets > 0 else 0.0
 
         return BacktestResult(
             config=config,
-            total_profit=state.total_profit,
+            total_profit=total_profit,
             total_bets=total_bets,
             total_wins=total_wins,
             win_rate=win_rate,
-            max_drawdown=state.max_drawdown,
+            max_drawdown=max_drawdown,
             profit_factor=profit_factor,
             sharpe_ratio=sharpe,
-            max_win_streak=state.max_win_streak,
-            max_loss_streak=state.max_loss_streak,
-            signals_fired=len(state.signals_fired),
+            max_win_streak=max_win_streak,
+            max_loss_streak=max_loss_streak,
+            signals_fired=signals_fired,
             avg_bet_size=avg_bet,
             roi=roi,
         )
@@ -555,14 +1267,14 @@ class BacktestEngine:
         """Handle the result of an active bet."""
         bet_amount = state.current_bet
 
-        if mult >= state.config.auto_cashout:
+        if mult >= state._cashout_at:
             # WIN
             profit = bet_amount * (state.config.auto_cashout - 1)
             state.total_wins += 1
             state.total_bets += 1
             state.record_outcome("win")
             state.update_stats(profit)
-            state.bets_placed.append((round_num, bet_amount, mult, "win"))
+            state.record_bet(round_num, bet_amount, mult, "win")
 
             state.win_streak += 1
             state.loss_streak = 0
@@ -592,7 +1304,7 @@ class BacktestEngine:
             state.total_bets += 1
             state.record_outcome("loss")
             state.update_stats(-loss)
-            state.bets_placed.append((round_num, bet_amount, mult, "loss"))
+            state.record_bet(round_num, bet_amount, mult, "loss")
 
             state.loss_streak += 1
             state.win_streak = 0
@@ -630,26 +1342,134 @@ class BacktestEngine:
         state.current_bet = state.next_bet()
         state.waiting_for_result = True
 
+    def _fast_forward_bets(
+        self, state: SimulationState, mults: np.ndarray, start: int
+    ) -> Tuple[int, np.ndarray]:
+        """Settle every round of a betting run up to the one that ends it.
+
+        While a run is live nothing but _handle_result acts: it is active, so
+        monitoring, activation and signal checks are all skipped, and no
+        cooldown is pending.  Rounds that merely continue the run (a win
+        below stop-profit, a loss under both loss limits) are settled here in
+        bulk; the terminating round is left to the per-round loop.  Running
+        totals use cumsum so they round exactly like the scalar updates.
+
+        Returns the index of the first unsettled round and the profits of
+        the settled ones.
+        """
+        config = state.config
+        ac = config.auto_cashout
+        window = max(config.loss_check_window, 0)
+        table = np.array(state._bet_table)
+
+        all_profits = []
+        i = start
+        chunk = 64
+        while i < len(mults):
+            seg = mults[i : i + chunk]
+            chunk *= 2
+            n = len(seg)
+            win = seg >= state._cashout_at
+            loss = ~win
+            idx = np.arange(n)
+
+            # Consecutive losses after each round, carried in from the state
+            c0 = state.consecutive_losses
+            c_after = idx - np.maximum.accumulate(np.where(win, idx, -1 - c0))
+            c_before = np.concatenate(([c0], c_after[:-1]))
+
+            # Window losses including the outcomes recorded before this run
+            prior = np.array([o == "loss" for o in state.recent_outcomes], dtype=bool)
+            losses = np.concatenate((prior, loss))
+            cum = np.concatenate(([0], np.cumsum(losses)))
+            end = len(prior) + idx + 1
+            in_window = cum[end] - cum[np.maximum(end - window, 0)]
+            window_full = np.minimum(end, window) >= window
+
+            wins_so_far = state.total_wins + np.cumsum(win)
+            stops = (
+                (loss & (c_after >= config.max_consecutive_losses))
+                | (loss & window_full & (in_window >= config.max_losses_in_window))
+                | (
+                    win
+                    & (config.stop_profit_count > 0)
+                    & (wins_so_far >= config.stop_profit_count)
+                )
+            )
+            k = int(np.argmax(stops)) if stops.any() else n
+            if k == 0:
+                break
+
+            # Apply rounds [i, i + k), none of which ends the run
+            bets = table[c_before[:k]]
+            won = win[:k]
+            profits = np.where(won, bets * (ac - 1), -bets)
+            totals = np.cumsum(np.concatenate(([state.total_profit], profits)))[1:]
+            peaks = np.maximum.accumulate(np.concatenate(([state.peak_profit], totals)))
+            state.total_profit = float(totals[-1])
+            state.peak_profit = float(peaks[-1])
+            state.max_drawdown = max(
+                state.max_drawdown, float(np.max(peaks[1:] - totals))
+            )
+
+            n_won = int(np.count_nonzero(won))
+            state.total_bets += k
+            state.total_wins += n_won
+            ws = idx[:k] - np.maximum.accumulate(
+                np.where(won, -1 - state.win_streak, idx[:k])
+            )
+            ls = idx[:k] - np.maximum.accumulate(
+                np.where(won, idx[:k], -1 - state.loss_streak)
+            )
+            state.max_win_streak = max(state.max_win_streak, int(ws.max()))
+            state.max_loss_streak = max(state.max_loss_streak, int(ls.max()))
+            state.win_streak = int(ws[-1])
+            state.loss_streak = int(ls[-1])
+
+            outcomes = ["win" if w else "loss" for w in won.tolist()]
+            recent = state.recent_outcomes + outcomes
+            state.recent_outcomes = recent[max(0, len(recent) - window) :]
+            state.total_wagered = _running_sum(state.total_wagered, bets)
+            if state.record_details:
+                state.bets_placed.extend(
+                    zip(
+                        range(i + 1, i + k + 1),
+                        bets.tolist(),
+                        seg[:k].tolist(),
+                        outcomes,
+                    )
+                )
+            state.consecutive_losses = int(c_after[k - 1])
+            state.current_bet = state.next_bet()
+
+            all_profits.append(profits)
+            i += k
+            if k < n:
+                break
+
+        if not all_profits:
+            return i, np.empty(0)
+        return i, np.concatenate(all_profits)
+
     def _check_hotstreak_activation(
-        self, state: SimulationState, tracker: HotstreakTracker, round_num: int
+        self, state: SimulationState, signals: int, round_num: int
     ):
         """Check for hotstreak-based activation."""
         if state.is_active or state.waiting_for_result or state.in_cooldown():
             return
 
-        if tracker.current_hotstreak is None:
+        if not signals & HOTSTREAK_SIGNALS:
             return
 
-        hs_type = tracker.current_hotstreak.type
-        if state.should_activate_on_hotstreak(hs_type):
-            state.signals_fired.append((round_num, f"{hs_type}_hotstreak"))
-            state.stop_monitoring()
-            self._place_bet(state, round_num)
+        hs_type = "strong" if signals & SIG_STRONG_HOTSTREAK else "weak"
+        state.record_signal(round_num, f"{hs_type}_hotstreak")
+        state.stop_monitoring()
+        self._place_bet(state, round_num)
 
     def _signal_triggered(
         self,
         state: SimulationState,
-        tracker: HotstreakTracker,
+        recent: List[float],
         reason: str,
         round_num: int,
     ):
@@ -658,9 +1478,8 @@ class BacktestEngine:
             return
 
         # Check immediate confirmation
-        recent = tracker.get_last_n(state.config.signal_confirm_window)
         if state.check_confirmation(recent):
-            state.signals_fired.append((round_num, f"{reason} (confirmed)"))
+            state.record_signal(round_num, f"{reason} (confirmed)")
             self._place_bet(state, round_num)
         else:
             # Start monitoring
@@ -670,7 +1489,6 @@ class BacktestEngine:
         self,
         state: SimulationState,
         mult: float,
-        tracker: HotstreakTracker,
         round_num: int,
     ):
         """Process a round during signal monitoring."""
@@ -680,11 +1498,11 @@ class BacktestEngine:
         # Check confirmation
         if len(state.monitoring_history) >= state.config.signal_confirm_window:
             last_n = state.monitoring_history[-state.config.signal_confirm_window :]
-            above = sum(1 for m in last_n if m >= state.config.signal_confirm_threshold)
+            above = sum(1 for m in last_n if m >= state._confirm_at)
             if above >= state.config.signal_confirm_count:
                 if not state.is_active and not state.in_cooldown():
                     reason = state.pending_signal_reason or "signal"
-                    state.signals_fired.append((round_num, f"{reason} (confirmed)"))
+                    state.record_signal(round_num, f"{reason} (confirmed)")
                     state.stop_monitoring()
                     self._place_bet(state, round_num)
                     return
@@ -694,34 +1512,22 @@ class BacktestEngine:
             state.stop_monitoring()
 
     def _analyze_signals(
-        self, state: SimulationState, tracker: HotstreakTracker, round_num: int
+        self,
+        state: SimulationState,
+        mults: List[float],
+        i: int,
+        signals: int,
+        round_num: int,
     ):
-        """Analyze for signal triggers."""
-        if state.is_active or tracker.in_hotstreak() or state.in_cooldown():
+        """Act on the activated, non-hotstreak signals seen at round i."""
+        if state.is_active or state.in_cooldown():
             return
 
-        triggered_signals = []
-
-        for win_size, min_len in [(10, 10), (15, 15)]:
-            window = tracker.get_last_n(win_size)
-            if len(window) < min_len:
-                continue
-            signals = analyze_window(window, win_size)
-            for sig in signals:
-                if sig == "high_stddev":
-                    if state.should_activate_on_high_stddev(win_size):
-                        triggered_signals.append(f"{sig}_w{win_size}")
-                elif state.should_activate_on_signal(sig):
-                    triggered_signals.append(sig)
-
-        if tracker.just_ended_hotstreak():
-            for sig in check_chain_patterns(tracker):
-                if state.should_activate_on_signal(sig):
-                    triggered_signals.append(sig)
-
-        if triggered_signals and not state.is_active:
-            reason = ", ".join(triggered_signals)
-            self._signal_triggered(state, tracker, reason, round_num)
+        if signals & ~HOTSTREAK_SIGNALS and not state.is_active:
+            reason = ", ".join(name for bit, name in SIGNAL_NAMES if signals & bit)
+            window = state.config.signal_confirm_window
+            recent = mults[max(0, i + 1 - window) : i + 1]
+            self._signal_triggered(state, recent, reason, round_num)
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -729,37 +1535,66 @@ class BacktestEngine:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
+# "sqlite" (default) or "duckdb" for the bulk multipliers scan
+DB_PROVIDER = os.environ.get("BACKTEST_DB_PROVIDER", "sqlite").lower()
+
+MULTIPLIER_SCAN_SQL = """
+    SELECT session_id, multiplier FROM {table}
+    WHERE session_id IS NOT NULL
+    ORDER BY session_id ASC, id ASC
+"""
+
+
+def _scan_multipliers_duckdb(db_path: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Columnar scan of the multipliers table straight into NumPy arrays."""
+    con = duckdb.connect()
+    try:
+        cols = con.execute(
+            MULTIPLIER_SCAN_SQL.format(table="sqlite_scan(?, 'multipliers')"),
+            [db_path],
+        ).fetchnumpy()
+    finally:
+        con.close()
+    return (
+        np.asarray(cols["session_id"], dtype=np.int64),
+        np.asarray(cols["multiplier"], dtype=np.float32),
+    )
+
+
 def load_sessions(db_path: str) -> List[SessionData]:
     """Load session data from SQLite database."""
     conn = sqlite3.connect(db_path)
+    # 64 MB page cache so the full multipliers scan stays in memory
+    conn.execute("PRAGMA cache_size = -65536")
     cursor = conn.cursor()
 
-    # Get all sessions
     cursor.execute("""
-        SELECT s.id, s.start_timestamp, s.end_timestamp, COUNT(m.id)
-        FROM sessions s
-        LEFT JOIN multipliers m ON s.id = m.session_id
-        GROUP BY s.id
-        ORDER BY s.id ASC
+        SELECT id, start_timestamp, end_timestamp
+        FROM sessions
+        ORDER BY id ASC
     """)
     sessions_info = cursor.fetchall()
 
+    # Every multiplier in one ordered scan, split per session below
+    if DB_PROVIDER == "duckdb" and duckdb is not None:
+        session_ids, mults = _scan_multipliers_duckdb(db_path)
+    else:
+        if DB_PROVIDER == "duckdb":
+            print("duckdb is not installed; reading multipliers with sqlite3")
+        cursor.execute(MULTIPLIER_SCAN_SQL.format(table="multipliers"))
+        rows = np.array(cursor.fetchall(), dtype=[("sid", "i8"), ("mult", "f4")])
+        session_ids, mults = rows["sid"], rows["mult"]
+    conn.close()
+
+    sids, starts = np.unique(session_ids, return_index=True)
+    by_session = dict(zip(sids.tolist(), np.split(mults, starts[1:])))
+
     sessions = []
-    for sid, start_ts, end_ts, count in sessions_info:
-        if count == 0:
+    for sid, start_ts, end_ts in sessions_info:
+        mults = by_session.get(sid)
+        if mults is None:
             continue
 
-        # Get multipliers for this session in order
-        cursor.execute(
-            """
-            SELECT multiplier FROM multipliers
-            WHERE session_id = ?
-            ORDER BY id ASC
-        """,
-            (sid,),
-        )
-        mults = [row[0] for row in cursor.fetchall()]
-
         sessions.append(
             SessionData(
                 session_id=sid,
@@ -769,7 +1604,6 @@ def load_sessions(db_path: str) -> List[SessionData]:
             )
         )
 
-    conn.close()
     return sessions
 
 
@@ -790,181 +1624,454 @@ def get_db_path() -> str:
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
-def generate_configs(grid: Dict, max_configs: int = 1000) -> List[CustomConfig]:
-    """Generate config combinations from grid."""
+# Parameters that only matter for confirmed (non-hotstreak) signal activations
+CONFIRM_PARAMS = (
+    "signal_confirm_threshold",
+    "signal_confirm_count",
+    "signal_confirm_window",
+    "signal_monitor_rounds",
+)
+
+
+def _canonical_params(params: Dict, grid: Dict) -> Optional[Dict]:
+    """Collapse parameters a combination never reads, or None if it is invalid.
+
+    Two combinations with the same canonical form simulate identically:
+    cooldown_after_win is only read by stop-profit, and the confirm/monitor
+    settings only by non-hotstreak signals.
+    """
+    config = CustomConfig(**params)
+    activation = config.activation_mask()
+    if not activation:
+        return None
+    if config.signal_confirm_count > config.signal_confirm_window:
+        return None  # confirmation could never succeed
+
+    params = dict(params)
+    if config.stop_profit_count == 0 and "cooldown_after_win" in params:
+        params["cooldown_after_win"] = grid["cooldown_after_win"][0]
+    if not activation & ~HOTSTREAK_SIGNALS:
+        for key in CONFIRM_PARAMS:
+            if key in params:
+                params[key] = grid[key][0]
+    return params
+
+
+def generate_configs(grid: Dict) -> Iterator[CustomConfig]:
+    """Yield distinct config combinations from grid, lazily.
+
+    Cap the output with itertools.islice.
+    """
     keys = list(grid.keys())
+    grid = {k: list(dict.fromkeys(grid[k])) for k in keys}
     values = [grid[k] for k in keys]
 
-    configs = []
+    seen = set()
     for combo in itertools.product(*values):
-        if len(configs) >= max_configs:
-            break
-        params = dict(zip(keys, combo))
-
-        # Skip invalid combinations (e.g., both hotstreaks off AND all signals off)
-        if not any(
-            [
-                params.get("activate_on_strong_hotstreak", False),
-                params.get("activate_on_weak_hotstreak", False),
-                params.get("activate_on_rule_of_17", False),
-                params.get("activate_on_pre_streak_pattern", False),
-                params.get("activate_on_possible_chain", False),
-                params.get("activate_on_high_deviation_10", False),
-                params.get("activate_on_high_deviation_15", False),
-            ]
-        ):
+        params = _canonical_params(dict(zip(keys, combo)), grid)
+        if params is None:
+            continue
+
+        key = tuple(params[k] for k in keys)
+        if key in seen:
             continue
+        seen.add(key)
+        yield CustomConfig(**params)
+
 
+def _sample_configs(
+    grid: Dict,
+    subgrids: List[Dict],
+    n_samples: int,
+    rng: random.Random,
+    seen: set,
+) -> List[CustomConfig]:
+    """Draw up to n_samples distinct configs, cycling over subgrids of grid."""
+    keys = list(grid.keys())
+    configs = []
+    attempts = 0
+    while len(configs) < n_samples and attempts < n_samples * 50:
+        subgrid = subgrids[attempts % len(subgrids)]
+        attempts += 1
+        params = _canonical_params({k: rng.choice(subgrid[k]) for k in keys}, grid)
+        if params is None:
+            continue
+
+        key = tuple(params[k] for k in keys)
+        if key in seen:
+            continue
+        seen.add(key)
         configs.append(CustomConfig(**params))
 
     return configs
 
 
+def generate_configs_random(
+    grid: Dict,
+    n_samples: int,
+    rng: Optional[random.Random] = None,
+    seen: Optional[set] = None,
+) -> List[CustomConfig]:
+    """Sample configs by drawing each parameter independently from the grid."""
+    grid = {k: list(dict.fromkeys(v)) for k, v in grid.items()}
+    if seen is None:
+        seen = set()
+    return _sample_configs(grid, [grid], n_samples, rng or random.Random(), seen)
+
+
+def refine_around(
+    best_results: List[BacktestResult],
+    grid: Dict,
+    n_samples: int,
+    rng: Optional[random.Random] = None,
+    seen: Optional[set] = None,
+) -> List[CustomConfig]:
+    """Resample around the given winners, one grid step either side of each value."""
+    grid = {k: list(dict.fromkeys(v)) for k, v in grid.items()}
+    narrowed = []
+    for result in best_results:
+        local = {}
+        for key, options in grid.items():
+            idx = options.index(getattr(result.config, key))
+            local[key] = options[max(0, idx - 1) : idx + 2]
+        narrowed.append(local)
+    if not narrowed:
+        return []
+    if seen is None:
+        seen = set()
+    return _sample_configs(grid, narrowed, n_samples, rng or random.Random(), seen)
+
+
+# Betting runs that last this many rounds are finished by
+# BacktestEngine._fast_forward_bets; most runs end within a few rounds, where
+# the per-round loop is cheaper than setting up the array pass.
+FAST_FORWARD_MIN_RUN = 32
+
+
+def _running_sum(total: float, values: np.ndarray) -> float:
+    """Add values to total one at a time, as a scalar += loop would."""
+    if not len(values):
+        return total
+    return float(np.cumsum(np.concatenate(([total], values)))[-1])
+
+
+# Per-process engine.  It is built once in the parent, so signal detection
+# runs once rather than once per worker; forked workers inherit it
+# copy-on-write and other start methods get it pickled once per worker.
+_worker_engine: Optional[BacktestEngine] = None
+
+
+def _init_worker(engine: Optional[BacktestEngine] = None):
+    global _worker_engine
+    if engine is not None:
+        _worker_engine = engine
+
+
+def _run_one(config: CustomConfig) -> BacktestResult:
+    return _worker_engine.run(config)
+
+
+SORT_KEYS = {
+    "profit": lambda r: r.total_profit,
+    "roi": lambda r: r.roi,
+    "winrate": lambda r: r.win_rate,
+    "score": lambda r: r.score(),
+    "sharpe": lambda r: r.sharpe_ratio,
+    "drawdown": lambda r: -r.max_drawdown,  # Lower drawdown is better
+    "profit_factor": lambda r: (
+        r.profit_factor if r.profit_factor != float("inf") else 999999
+    ),
+}
+
+
 def run_grid_search(
     sessions: List[SessionData],
     grid: Dict,
     max_configs: int = 500,
     verbose: bool = True,
     sort_by: str = "profit",
+    n_jobs: int = -1,
+    strategy: str = "grid",
+    zoom_rounds: int = 2,
+    top_k: int = 5,
+    seed: Optional[int] = None,
+    sort_results: bool = True,
 ) -> List[BacktestResult]:
-    """Run backtests for all config combinations.
+    """Run backtests over configs drawn from the grid.
 
     Args:
         sort_by: "profit", "roi", "winrate", "score", "sharpe", "drawdown"
+        n_jobs: Worker processes; -1 uses every CPU, 1 runs serially.
+        strategy: "grid" walks the combinations in order, "random" samples
+            them, and "zoom" samples randomly then spends zoom_rounds more
+            rounds resampling one grid step around the top_k results so far.
+            max_configs is the total budget in every case.
+        sort_results: Rank the returned list by sort_by.  Callers that only
+            need the best few can skip the full sort and use top_results.
     """
-    configs = generate_configs(grid, max_configs)
-    if verbose:
-        print(f"Testing {len(configs)} configurations...")
+    keys = None
 
-    engine = BacktestEngine(sessions)
-    results = []
-
-    for i, config in enumerate(configs):
-        result = engine.run(config)
-        results.append(result)
-
-        if verbose and (i + 1) % 50 == 0:
-            print(f"  Progress: {i + 1}/{len(configs)}")
-
-    # Sort by specified metric
-    sort_keys = {
-        "profit": lambda r: r.total_profit,
-        "roi": lambda r: r.roi,
-        "winrate": lambda r: r.win_rate,
-        "score": lambda r: r.score(),
-        "sharpe": lambda r: r.sharpe_ratio,
-        "drawdown": lambda r: -r.max_drawdown,  # Lower drawdown is better
-        "profit_factor": lambda r: (
-            r.profit_factor if r.profit_factor != float("inf") else 999999
-        ),
-    }
+    if n_jobs < 0:
+        n_jobs = os.cpu_count() or 1
 
-    sort_key = sort_keys.get(sort_by, sort_keys["profit"])
-    results.sort(key=sort_key, reverse=True)
+    global _worker_engine
+    engine = BacktestEngine(sessions)
+    executor = None
+    if n_jobs > 1:
+        if multiprocessing.get_start_method() == "fork":
+            _worker_engine = engine
+            initargs = ()
+        else:
+            initargs = (engine,)
+        executor = ProcessPoolExecutor(
+            max_workers=n_jobs, initializer=_init_worker, initargs=initargs
+        )
 
-    if verbose:
-        print(f"\nResults sorted by: {sort_by.upper()}")
+    def run_batch(configs: Iterable[CustomConfig], total: int) -> List[BacktestResult]:
+        """Run configs (at most total of them) in order."""
+        if verbose:
+            print(f"Testing up to {total} configurations...")
+        if executor is None:
+            result_iter = map(engine.run, configs)
+        else:
+            chunksize = max(1, total // (n_jobs * 4))
+            result_iter = executor.map(_run_one, configs, chunksize=chunksize)
+
+        batch = []
+        for i, result in enumerate(result_iter):
+            batch.append(result)
+
+            if verbose and (i + 1) % 50 == 0:
+                print(f"  Progress: {i + 1}/{total}")
+        return batch
+
+    try:
+        if strategy == "grid":
+            configs = itertools.islice(generate_configs(grid), max_configs)
+            results = run_batch(configs, max_configs)
+        elif strategy == "random":
+            rng = random.Random(seed)
+            configs = generate_configs_random(grid, max_configs, rng)
+            results = run_batch(configs, len(configs))
+        else:
+            rng = random.Random(seed)
+            seen = set()
+            per_round = max(1, max_configs // (zoom_rounds + 1))
+            configs = generate_configs_random(grid, per_round, rng, seen)
+            results = run_batch(configs, len(configs))
+            # Extended batch by batch, so each round only ranks
+            keys = sort_key_array(results, sort_by)
+            for round_idx in range(zoom_rounds):
+                budget = max_configs - len(results)
+                if round_idx < zoom_rounds - 1:
+                    budget = min(budget, per_round)
+                best = [results[i] for i in _rank(keys)[:top_k]]
+                configs = refine_around(best, grid, budget, rng, seen)
+                if not configs:
+                    break
+                if verbose:
+                    print(f"Zoom round {round_idx + 1}/{zoom_rounds}")
+                batch = run_batch(configs, len(configs))
+                results.extend(batch)
+                keys = np.concatenate((keys, sort_key_array(batch, sort_by)))
+    finally:
+        if executor is not None:
+            executor.shutdown()
+            _worker_engine = None
+
+    if sort_results:
+        if keys is None:
+            keys = sort_key_array(results, sort_by)
+        results = [results[i] for i in _rank(keys)]
+        if verbose:
+            print(f"\nResults sorted by: {sort_by.upper()}")
 
     return results
 
 
+def sort_key_array(results: List[BacktestResult], sort_by: str = "profit") -> np.ndarray:
+    """The SORT_KEYS value of every result, computed once into an array."""
+    key = SORT_KEYS.get(sort_by, SORT_KEYS["profit"])
+    return np.fromiter(map(key, results), dtype=np.float64, count=len(results))
+
+
+def _rank(keys: np.ndarray) -> np.ndarray:
+    """Indices from the highest key down; ties keep list order."""
+    return np.argsort(-keys, kind="stable")
+
+
+def top_results(
+    results: List[BacktestResult],
+    sort_by: str = "profit",
+    n: int = 20,
+    keys: Optional[np.ndarray] = None,
+) -> List[BacktestResult]:
+    """The n best results by sort_by, ranked.
+
+    ``keys`` may be a sort_key_array for ``results`` that the caller already
+    has, to rank the same list repeatedly without recomputing it.
+    """
+    if keys is None:
+        keys = sort_key_array(results, sort_by)
+    return [results[i] for i in _rank(keys)[:n]]
+
+
+# Multiplier levels reported as "above_<n>x_pct" by analyze_data
+TAIL_THRESHOLDS = (2.0, 3.0, 5.0, 10.0)
+
+
+def _moments(a):
+    """Mean, population std, min and max of a non-empty float64 array.
+
+    Two passes over ``a`` in total, where the separate NumPy reductions take
+    one each (std two).
+    """
+    total = 0.0
+    lo = a[0]
+    hi = a[0]
+    for x in a:
+        total += x
+        lo = min(lo, x)
+        hi = max(hi, x)
+    mean = total / a.shape[0]
+    sq = 0.0
+    for x in a:
+        d = x - mean
+        sq += d * d
+    return mean, np.sqrt(sq / a.shape[0]), lo, hi
+
+
+_moments_nb = njit(cache=True)(_moments) if njit else None
+
+
 def analyze_data(sessions: List[SessionData]) -> Dict:
     """Analyze the historical data for insights."""
-    all_mults = []
-    for s in sessions:
-        all_mults.extend(s.multipliers)
+    if not sessions:
+        return {"error": "No data"}
 
-    if not all_mults:
+    # Session multipliers are already arrays, so this is one bulk copy
+    arr = np.concatenate([s.multipliers for s in sessions]).astype(np.float64)
+    total_rounds = arr.size
+    if not total_rounds:
         return {"error": "No data"}
 
-    arr = np.array(all_mults)
+    # One broadcast comparison covers every threshold
+    tail_pcts = (arr[:, None] >= np.array(TAIL_THRESHOLDS)).mean(axis=0) * 100
 
-    return {
-        "total_rounds": len(all_mults),
+    if _moments_nb is not None:
+        mean, std, lo, hi = _moments_nb(arr)
+    else:
+        mean, std, lo, hi = arr.mean(), arr.std(), arr.min(), arr.max()
+
+    stats = {
+        "total_rounds": total_rounds,
         "total_sessions": len(sessions),
-        "mean": float(np.mean(arr)),
-        "median": float(np.median(arr)),
-        "std": float(np.std(arr)),
-        "min": float(np.min(arr)),
-        "max": float(np.max(arr)),
-        "above_2x_pct": float(
-            sum(1 for m in all_mults if m >= 2.0) / len(all_mults) * 100
-        ),
-        "above_3x_pct": float(
-            sum(1 for m in all_mults if m >= 3.0) / len(all_mults) * 100
-        ),
-        "above_5x_pct": float(
-            sum(1 for m in all_mults if m >= 5.0) / len(all_mults) * 100
-        ),
-        "above_10x_pct": float(
-            sum(1 for m in all_mults if m >= 10.0) / len(all_mults) * 100
-        ),
-        "rounds_per_session_avg": len(all_mults) / len(sessions),
+        "mean": mean,
+        # arr is a private copy, so the median may partition it in place
+        "median": np.median(arr, overwrite_input=True),
+        "std": std,
+        "min": lo,
+        "max": hi,
     }
-
-
-def print_results(results: List[BacktestResult], top_n: int = 20):
-    """Print formatted results."""
-    print("\n" + "=" * 100)
-    print(f"TOP {top_n} CONFIGURATIONS (sorted by highest profit)")
-    print("=" * 100)
-
-    for i, r in enumerate(results[:top_n]):
-        print(f"\n{'─' * 100}")
-        print(
-            f"RANK #{i + 1}  |  💰 PROFIT: {r.total_profit:+,.0f}  |  ROI: {r.roi * 100:+.2f}%"
-        )
-        print(f"{'─' * 100}")
-        print(
-            f"  Win Rate: {r.win_rate * 100:.1f}%  |  Bets: {r.total_bets}  |  Wins: {r.total_wins}  |  Signals: {r.signals_fired}"
-        )
-        print(
-            f"  Max Drawdown: {r.max_drawdown:,.0f}  |  Profit Factor: {r.profit_factor:.2f}  |  Sharpe: {r.sharpe_ratio:.3f}"
-        )
-        print(
-            f"  Max Win Streak: {r.max_win_streak}  |  Max Loss Streak: {r.max_loss_streak}  |  Avg Bet: {r.avg_bet_size:,.0f}"
-        )
-        print(f"\n  Config:")
-        print(
-            f"    base_bet={r.config.base_bet}, auto_cashout={r.config.auto_cashout}x, bet_mult={r.config.bet_multiplier}"
-        )
-        print(
-            f"    max_losses={r.config.max_consecutive_losses}, window_losses={r.config.max_losses_in_window}/{r.config.loss_check_window}"
-        )
-        print(
-            f"    stop_profit={r.config.stop_profit_count}, cd_win={r.config.cooldown_after_win}, cd_loss={r.config.cooldown_after_loss}"
-        )
-        print(
-            f"    confirm: {r.config.signal_confirm_count}/{r.config.signal_confirm_window} > {r.config.signal_confirm_threshold}x, monitor={r.config.signal_monitor_rounds}"
+    for threshold, pct in zip(TAIL_THRESHOLDS, tail_pcts):
+        stats[f"above_{threshold:g}x_pct"] = pct
+    stats["rounds_per_session_avg"] = total_rounds / len(sessions)
+    return stats
+
+
+# Short names print_results gives the activation bits, in print order
+TRIGGER_LABELS = (
+    (SIG_STRONG_HOTSTREAK, "strong_hs"),
+    (SIG_WEAK_HOTSTREAK, "weak_hs"),
+    (SIG_RULE_OF_17, "rule17"),
+    (SIG_PRE_STREAK, "pre_streak"),
+    (SIG_POSSIBLE_CHAIN, "possible_chain"),
+    (SIG_HIGH_STDDEV_10, "stddev10"),
+    (SIG_HIGH_STDDEV_15, "stddev15"),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _trigger_list(mask: int) -> str:
+    """Comma-separated TRIGGER_LABELS for an activation mask."""
+    return ", ".join(label for bit, label in TRIGGER_LABELS if mask & bit)
+
+
+# One print_results entry; CustomConfig fields are available by name
+_RESULT_TEMPLATE = f"""
+{'─' * 100}
+RANK #{{rank}}  |  💰 PROFIT: {{profit:+,.0f}}  |  ROI: {{roi:+.2f}}%
+{'─' * 100}
+  Win Rate: {{win_rate:.1f}}%  |  Bets: {{bets}}  |  Wins: {{wins}}  |  Signals: {{signals}}
+  Max Drawdown: {{drawdown:,.0f}}  |  Profit Factor: {{profit_factor:.2f}}  |  Sharpe: {{sharpe:.3f}}
+  Max Win Streak: {{max_win_streak}}  |  Max Loss Streak: {{max_loss_streak}}  |  Avg Bet: {{avg_bet:,.0f}}
+
+  Config:
+    base_bet={{base_bet}}, auto_cashout={{auto_cashout}}x, bet_mult={{bet_multiplier}}
+    max_losses={{max_consecutive_losses}}, window_losses={{max_losses_in_window}}/{{loss_check_window}}
+    stop_profit={{stop_profit_count}}, cd_win={{cooldown_after_win}}, cd_loss={{cooldown_after_loss}}
+    confirm: {{signal_confirm_count}}/{{signal_confirm_window}} > {{signal_confirm_threshold}}x, monitor={{signal_monitor_rounds}}
+    triggers: [{{triggers}}]"""
+
+
+def print_results(
+    results: List[BacktestResult], top_n: int = 20, sort_by: Optional[str] = None
+):
+    """Print formatted results.
+
+    ``results`` must already be ranked unless ``sort_by`` is given, in which
+    case the top ``top_n`` are picked from them here.
+    """
+    top = top_results(results, sort_by, top_n) if sort_by else results[:top_n]
+    out = []
+    w = out.append
+    w("\n" + "=" * 100)
+    w(f"TOP {top_n} CONFIGURATIONS (sorted by highest profit)")
+    w("=" * 100)
+
+    for i, r in enumerate(top):
+        w(
+            _RESULT_TEMPLATE.format_map(
+                {
+                    **r.config._asdict(),
+                    "rank": i + 1,
+                    "profit": r.total_profit,
+                    "roi": r.roi * 100,
+                    "win_rate": r.win_rate * 100,
+                    "bets": r.total_bets,
+                    "wins": r.total_wins,
+                    "signals": r.signals_fired,
+                    "drawdown": r.max_drawdown,
+                    "profit_factor": r.profit_factor,
+                    "sharpe": r.sharpe_ratio,
+                    "max_win_streak": r.max_win_streak,
+                    "max_loss_streak": r.max_loss_streak,
+                    "avg_bet": r.avg_bet_size,
+                    "triggers": _trigger_list(r.config.activation_mask()),
+                }
+            )
         )
-        triggers = []
-        if r.config.activate_on_strong_hotstreak:
-            triggers.append("strong_hs")
-        if r.config.activate_on_weak_hotstreak:
-            triggers.append("weak_hs")
-        if r.config.activate_on_rule_of_17:
-            triggers.append("rule17")
-        if r.config.activate_on_pre_streak_pattern:
-            triggers.append("pre_streak")
-        if r.config.activate_on_possible_chain:
-            triggers.append("possible_chain")
-        if r.config.activate_on_high_deviation_10:
-            triggers.append("stddev10")
-        if r.config.activate_on_high_deviation_15:
-            triggers.append("stddev15")
-        print(f"    triggers: [{', '.join(triggers)}]")
 
     # Summary statistics
     if results:
         profitable = [r for r in results if r.total_profit > 0]
-        print(f"\n{'=' * 100}")
-        print(f"SUMMARY: {len(profitable)}/{len(results)} configs were profitable")
+        w(f"\n{'=' * 100}")
+        w(f"SUMMARY: {len(profitable)}/{len(results)} configs were profitable")
         if profitable:
-            print(f"  Best profit: {results[0].total_profit:+,.0f}")
-            print(
+            w(f"  Best profit: {top[0].total_profit:+,.0f}")
+            w(
                 f"  Avg profit (profitable only): {sum(r.total_profit for r in profitable) / len(profitable):+,.0f}"
             )
-        print("=" * 100)
+        w("=" * 100)
+
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+def _json_default(obj):
+    """json.dump fallback for NumPy scalars, which orjson handles natively."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 def export_best_config(result: BacktestResult, output_path: str = "best_config.json"):
@@ -1004,8 +2111,18 @@ def export_best_config(result: BacktestResult, output_path: str = "best_config.j
         },
     }
 
-    with open(output_path, "w") as f:
-        json.dump(config, f, indent=2)
+    # orjson has no Infinity literal, so a loss-free profit factor goes
+    # through json as before
+    if orjson is not None and math.isfinite(result.profit_factor):
+        with open(output_path, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    config, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                )
+            )
+    else:
+        with open(output_path, "w") as f:
+            json.dump(config, f, indent=2, default=_json_default)
 
     print(f"\nBest config exported to: {output_path}")
 
@@ -1015,85 +2132,121 @@ def export_best_config(result: BacktestResult, output_path: str = "best_config.j
 # ═══════════════════════════════════════════════════════════════════════════════
 
 
+# Signal types as analyze_signals reports them; the "type" field of
+# SIGNAL_EVENT_DTYPE indexes this tuple
+SIGNAL_EVENT_TYPES = (
+    "strong_hotstreak",
+    "weak_hotstreak",
+    *(f"{name}_w{size}" for size in SIGNAL_WINDOWS for name in ("pre_streak", "high_stddev")),
+    "possible_chain",
+    "dead_ass_chain",
+    "rule_of_17",
+)
+_EVENT_TYPE_IDS = {name: i for i, name in enumerate(SIGNAL_EVENT_TYPES)}
+
+SIGNAL_EVENT_DTYPE = np.dtype(
+    [
+        ("session_id", "i8"),
+        ("round", "i4"),
+        ("type", "i1"),
+        ("mult", "f4"),
+        ("window_avg", "f8"),
+    ]
+)
+
+
 def analyze_signals(sessions: List[SessionData], verbose: bool = True) -> Dict:
-    """Analyze all signals that would have fired in historical data."""
-    all_signals = []
+    """Analyze all signals that would have fired in historical data.
 
-    for session in sessions:
-        tracker = HotstreakTracker()
-
-        for i, mult in enumerate(session.multipliers):
-            round_num = i + 1
-            tracker.add_multiplier(mult)
-
-            # Check hotstreaks
-            if tracker.current_hotstreak:
-                hs = tracker.current_hotstreak
-                # Only record when hotstreak first detected
-                if hs.length == HOTSTREAK_MIN_WINDOW:
-                    all_signals.append(
-                        {
-                            "session_id": session.session_id,
-                            "round": round_num,
-                            "type": f"{hs.type}_hotstreak",
-                            "mult": mult,
-                            "window_avg": hs.average,
-                        }
-                    )
+    ``signals`` in the returned dict is a SIGNAL_EVENT_DTYPE array ordered by
+    session, then round, with ``type`` indexing SIGNAL_EVENT_TYPES.
+    """
+    n_orders = len(SIGNAL_WINDOWS) + 2
+    parts = []
 
-            # Check pattern signals
-            for win_size, min_len in [(10, 10), (15, 15)]:
-                window = tracker.get_last_n(win_size)
-                if len(window) >= min_len:
-                    signals = analyze_window(window, win_size)
-                    for sig in signals:
-                        all_signals.append(
-                            {
-                                "session_id": session.session_id,
-                                "round": round_num,
-                                "type": sig + f"_w{win_size}",
-                                "mult": mult,
-                                "window_avg": np.mean(window),
-                            }
-                        )
+    for session in sessions:
+        mults = session.multipliers
+        if len(mults) < MIN_SIGNAL_ROUNDS:
+            continue
+        sweep = sweep_hotstreaks(mults)
+        stats = session.window_stats()
+        # Round index, report order within the round, type id and window_avg
+        idx, order, types, avgs = [], [], [], []
+
+        # Hotstreaks, recorded when first detected
+        i = np.flatnonzero(sweep["length"] == HOTSTREAK_MIN_WINDOW)
+        idx.append(i)
+        order.append(np.zeros_like(i))
+        types.append(
+            np.where(
+                sweep["type"][i] == 2,
+                _EVENT_TYPE_IDS["strong_hotstreak"],
+                _EVENT_TYPE_IDS["weak_hotstreak"],
+            )
+        )
+        avgs.append(sweep["average"][i])
 
-            # Check chain patterns
-            if tracker.just_ended_hotstreak():
-                for sig in check_chain_patterns(tracker):
-                    all_signals.append(
-                        {
-                            "session_id": session.session_id,
-                            "round": round_num,
-                            "type": sig,
-                            "mult": mult,
-                            "window_avg": np.mean(tracker.get_last_n(10))
-                            if tracker.get_last_n(10)
-                            else 0,
-                        }
-                    )
+        # Pattern signals
+        for k, size in enumerate(SIGNAL_WINDOWS, start=1):
+            if len(mults) < size:
+                continue
+            mean = stats[f"mean{size}"]
+            bits = window_stat_bits(stats, size)
+            for bit, name in (
+                (SIG_PRE_STREAK, "pre_streak"),
+                (_HIGH_STDDEV_BITS[size], "high_stddev"),
+            ):
+                j = np.flatnonzero(bits & bit)
+                idx.append(j + size - 1)
+                order.append(np.full_like(j, k))
+                types.append(np.full_like(j, _EVENT_TYPE_IDS[f"{name}_w{size}"]))
+                avgs.append(mean[j])
+
+        # Chain patterns (always at least 10 rounds after a hotstreak)
+        chain = sweep["chain"]
+        for bit, name in SIGNAL_NAMES:
+            i = np.flatnonzero(chain & bit)
+            if len(i):
+                idx.append(i)
+                order.append(np.full_like(i, n_orders - 1))
+                types.append(np.full_like(i, _EVENT_TYPE_IDS[name]))
+                avgs.append(stats["mean10"][i - 9])
+
+        idx = np.concatenate(idx)
+        rank = np.argsort(idx * n_orders + np.concatenate(order), kind="stable")
+        events = np.empty(len(rank), dtype=SIGNAL_EVENT_DTYPE)
+        events["session_id"] = session.session_id
+        events["round"] = idx[rank] + 1
+        events["type"] = np.concatenate(types)[rank]
+        events["mult"] = mults[idx[rank]]
+        events["window_avg"] = np.concatenate(avgs)[rank]
+        parts.append(events)
+
+    all_signals = (
+        np.concatenate(parts) if parts else np.empty(0, dtype=SIGNAL_EVENT_DTYPE)
+    )
 
-    # Analyze signal success rates
-    signal_stats = {}
-    for sig in all_signals:
-        sig_type = sig["type"]
-        if sig_type not in signal_stats:
-            signal_stats[sig_type] = {
-                "count": 0,
-                "total_following": 0,
-                "following_above_2x": 0,
-            }
-        signal_stats[sig_type]["count"] += 1
+    # Analyze signal success rates, listing types in order of first appearance
+    counts = np.bincount(all_signals["type"], minlength=len(SIGNAL_EVENT_TYPES))
+    seen, first = np.unique(all_signals["type"], return_index=True)
+    signal_stats = {
+        SIGNAL_EVENT_TYPES[t]: {
+            "count": int(counts[t]),
+            "total_following": 0,
+            "following_above_2x": 0,
+        }
+        for t in seen[np.argsort(first)]
+    }
 
     if verbose:
-        print("\n" + "=" * 60)
-        print("SIGNAL ANALYSIS")
-        print("=" * 60)
-        print(f"\nTotal signals detected: {len(all_signals)}")
-        print("\nSignal frequency:")
+        out = ["\n" + "=" * 60, "SIGNAL ANALYSIS", "=" * 60]
+        out.append(f"\nTotal signals detected: {len(all_signals)}")
+        out.append("\nSignal frequency:")
         for sig_type, stats in sorted(
             signal_stats.items(), key=lambda x: x[1]["count"], reverse=True
         ):
-            print(f"  {sig_type}: {stats['count']} occurrences")
+            out.append(f"  {sig_type}: {stats['count']} occurrences")
+        sys.stdout.write("\n".join(out) + "\n")
 
     return {
         "total_signals": len(all_signals),
@@ -1142,6 +2295,21 @@ def main():
         default="profit",
         help="Sort results by metric (default: profit)",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=-1,
+        help="Worker processes for the grid search (-1 = all CPUs, 1 = serial)",
+    )
+    parser.add_argument(
+        "--strategy",
+        choices=["grid", "random", "zoom"],
+        default="zoom",
+        help="Config search: full grid walk, random sampling, or random + zoom-in",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None, help="Random seed for random/zoom search"
+    )
     args = parser.parse_args()
 
     # Find database
@@ -1181,12 +2349,20 @@ def main():
     if args.mode in ["backtest", "all"]:
         grid = CONFIG_GRID_FAST if args.fast else CONFIG_GRID
         results = run_grid_search(
-            sessions, grid, max_configs=args.max_configs, sort_by=args.sort_by
+            sessions,
+            grid,
+            max_configs=args.max_configs,
+            sort_by=args.sort_by,
+            n_jobs=args.jobs,
+            strategy=args.strategy,
+            seed=args.seed,
+            sort_results=False,
         )
-        print_results(results, top_n=args.top)
+        print(f"\nResults sorted by: {args.sort_by.upper()}")
+        print_results(results, top_n=args.top, sort_by=args.sort_by)
 
         if args.export and results:
-            export_best_config(results[0])
+            export_best_config(top_results(results, args.sort_by, 1)[0])
 
     print("\n" + "=" * 60)
     print("BACKTEST COMPLETE")
@@ -10,24 +10,97 @@ Usage:
 """
 
 import argparse
+import itertools
+import os
 import sqlite3
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 import json
 
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; analyze_outcome falls back to pure Python
+    njit = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; exports fall back to json
+    orjson = None
+
 # Import shared logic from backtest_simulator
 from backtest_simulator import (
     HotstreakTracker,
-    analyze_window,
     check_chain_patterns,
+    precompute_window_stats,
+    window_signal_names,
+    window_stat_bits,
     HOTSTREAK_MIN_WINDOW,
+    SIGNAL_EVENT_TYPES,
+    SIGNAL_WINDOWS,
 )
 
 
+# SignalTable.signal_type holds indexes into SIGNAL_EVENT_TYPES
+_TYPE_IDS = {name: i for i, name in enumerate(SIGNAL_EVENT_TYPES)}
+
+# Windows analyze_outcome reports on, as prefixes of SignalEvent.next_20
+OUTCOME_WINDOWS = (("next_5", 5), ("next_10", 10), ("next_20", 20))
+
+
+def simulate_martingales(window, targets, base_bet: float, checkpoints) -> np.ndarray:
+    """Martingale from base_bet over a window of multipliers, for each cashout target.
+
+    Every target takes one pass over the window.  ``out[t, c]`` holds
+    (total_profit, wins, max_loss_streak, rounds at or above the target) for
+    ``targets[t]`` after the first ``checkpoints[c]`` rounds; checkpoints are
+    ascending and the last one is ``len(window)``.
+    """
+    out = np.zeros((len(targets), len(checkpoints), 4))
+    
+    for t in range(len(targets)):
+        cashout_target = targets[t]
+        total_profit = 0.0
+        current_bet = base_bet
+        wins = 0
+        max_streak = 0
+        current_streak = 0
+        above = 0
+        c = 0
+        
+        for i in range(len(window)):
+            if window[i] >= cashout_target:
+                # Win
+                total_profit += current_bet * (cashout_target - 1)
+                wins += 1
+                above += 1
+                current_streak = 0
+                current_bet = base_bet  # Reset
+            else:
+                # Loss
+                total_profit -= current_bet
+                current_streak += 1
+                max_streak = max(max_streak, current_streak)
+                current_bet *= 2  # Martingale
+            
+            while c < len(checkpoints) and checkpoints[c] == i + 1:
+                out[t, c, 0] = total_profit
+                out[t, c, 1] = wins
+                out[t, c, 2] = max_streak
+                out[t, c, 3] = above
+                c += 1
+    
+    return out
+
+
+_simulate_martingales_nb = njit(cache=True)(simulate_martingales) if njit else None
+
+
 @dataclass
 class SignalEvent:
     """Records a signal and what happened after it."""
@@ -38,55 +111,141 @@ class SignalEvent:
     window_avg: float
     window_std: float
     
-    # What happened in the next N rounds
-    next_5: List[float] = field(default_factory=list)
-    next_10: List[float] = field(default_factory=list)
-    next_20: List[float] = field(default_factory=list)
+    # What happened in the next 20 rounds (fewer at the end of a session);
+    # a float64 view into the session's multipliers
+    next_20: np.ndarray = field(default_factory=lambda: np.empty(0))
+    
+    @property
+    def next_5(self) -> np.ndarray:
+        return self.next_20[:5]
+    
+    @property
+    def next_10(self) -> np.ndarray:
+        return self.next_20[:10]
     
     def analyze_outcome(self, cashout_target: float) -> Dict:
         """Analyze if betting after this signal would have been profitable."""
-        results = {}
+        return self.analyze_outcomes((cashout_target,))[cashout_target]
+    
+    def analyze_outcomes(self, cashout_targets: Tuple[float, ...]) -> Dict[float, Dict]:
+        """analyze_outcome for several targets, keyed by target.
         
-        for window_name, window in [("next_5", self.next_5), ("next_10", self.next_10), ("next_20", self.next_20)]:
-            if not window:
-                continue
-            
-            # Simulate martingale betting
-            total_profit = 0
-            base_bet = 1000
-            current_bet = base_bet
-            bets = 0
-            wins = 0
-            max_streak = 0
-            current_streak = 0
-            
-            for mult in window:
-                bets += 1
-                if mult >= cashout_target:
-                    # Win
-                    profit = current_bet * (cashout_target - 1)
-                    total_profit += profit
-                    wins += 1
-                    current_streak = 0
-                    current_bet = base_bet  # Reset
-                else:
-                    # Loss
-                    total_profit -= current_bet
-                    current_streak += 1
-                    max_streak = max(max_streak, current_streak)
-                    current_bet *= 2  # Martingale
-            
-            results[window_name] = {
-                "rounds": len(window),
-                "wins": wins,
-                "win_rate": wins / len(window) if window else 0,
-                "total_profit": total_profit,
-                "max_loss_streak": max_streak,
-                "above_target": sum(1 for m in window if m >= cashout_target),
-                "avg_mult": np.mean(window),
-            }
+        The shorter windows are prefixes of next_20, so one martingale pass
+        over next_20 per target covers all three.
+        """
+        n = len(self.next_20)
+        results = {target: {} for target in cashout_targets}
+        if not n:
+            return results
+        
+        out = self.outcome_table(cashout_targets)
+        for c, (window_name, size) in enumerate(OUTCOME_WINDOWS):
+            rounds = min(size, n)
+            avg_mult = np.mean(self.next_20[:rounds])
+            for t, target in enumerate(cashout_targets):
+                profit, wins, max_streak, above = out[t, c].tolist()
+                results[target][window_name] = {
+                    "rounds": rounds,
+                    "wins": int(wins),
+                    "win_rate": int(wins) / rounds,
+                    "total_profit": profit,
+                    "max_loss_streak": int(max_streak),
+                    "above_target": int(above),
+                    "avg_mult": avg_mult,
+                }
         
         return results
+    
+    def outcome_table(self, cashout_targets: Tuple[float, ...]) -> np.ndarray:
+        """simulate_martingales over next_20, checkpointed at each OUTCOME_WINDOWS size."""
+        return outcome_table(self.next_20, cashout_targets)
+
+
+def outcome_table(next_20: np.ndarray, cashout_targets: Tuple[float, ...]) -> np.ndarray:
+    """simulate_martingales over next_20, checkpointed at each OUTCOME_WINDOWS size.
+    
+    Windows longer than next_20 stop at its end; with no following rounds
+    every entry is zero.
+    """
+    n = len(next_20)
+    checkpoints = [min(size, n) for _, size in OUTCOME_WINDOWS]
+    
+    # Simulate martingale betting
+    if _simulate_martingales_nb is not None:
+        return _simulate_martingales_nb(
+            next_20, np.asarray(cashout_targets, dtype=np.float64), 1000.0, np.asarray(checkpoints)
+        )
+    return simulate_martingales(next_20.tolist(), cashout_targets, 1000.0, checkpoints)
+
+
+@dataclass
+class SignalTable:
+    """Detected signals as parallel arrays, one entry per signal.
+    
+    signal_type holds SIGNAL_EVENT_TYPES indexes; next_20 is zero-padded to
+    20 columns and n_following says how many of them are real rounds.
+    Indexing or iterating yields SignalEvent views.
+    """
+    session_id: np.ndarray
+    round_index: np.ndarray
+    signal_type: np.ndarray
+    mult_at_signal: np.ndarray
+    window_avg: np.ndarray
+    window_std: np.ndarray
+    next_20: np.ndarray
+    n_following: np.ndarray
+    
+    @classmethod
+    def from_session(cls, session_id: int, following: np.ndarray, round_index: List[int],
+                     signal_type: List[int], mult_at_signal: List[float],
+                     window_avg: List[float], window_std: List[float]) -> "SignalTable":
+        """Table for one session's signals; following is the whole session."""
+        rounds = np.asarray(round_index, dtype=np.int64)
+        
+        # Up to 20 rounds after each signal, padded with zeros
+        padded = np.concatenate([following, np.zeros(20)])
+        next_20 = padded[rounds[:, None] + np.arange(1, 21)]
+        
+        return cls(
+            session_id=np.full(len(rounds), session_id, dtype=np.int64),
+            round_index=rounds,
+            signal_type=np.asarray(signal_type, dtype=np.int8),
+            mult_at_signal=np.asarray(mult_at_signal, dtype=np.float64),
+            window_avg=np.asarray(window_avg, dtype=np.float64),
+            window_std=np.asarray(window_std, dtype=np.float64),
+            next_20=next_20,
+            n_following=np.minimum(len(following) - 1 - rounds, 20),
+        )
+    
+    @classmethod
+    def concatenate(cls, tables: List["SignalTable"]) -> "SignalTable":
+        if not tables:
+            return cls.from_session(0, np.empty(0), [], [], [], [], [])
+        return cls(*(np.concatenate([getattr(t, name) for t in tables]) for name in cls.__dataclass_fields__))
+    
+    def __len__(self) -> int:
+        return len(self.round_index)
+    
+    def __getitem__(self, i: int) -> SignalEvent:
+        return SignalEvent(
+            session_id=int(self.session_id[i]),
+            round_index=int(self.round_index[i]),
+            signal_type=SIGNAL_EVENT_TYPES[self.signal_type[i]],
+            mult_at_signal=float(self.mult_at_signal[i]),
+            window_avg=float(self.window_avg[i]),
+            window_std=float(self.window_std[i]),
+            next_20=self.next_20[i, :self.n_following[i]],
+        )
+    
+    def __iter__(self):
+        return map(self.__getitem__, range(len(self)))
+    
+    def outcome_tables(self, cashout_targets: Tuple[float, ...]) -> np.ndarray:
+        """outcome_table for every signal, stacked along a leading axis."""
+        out = np.zeros((len(self), len(cashout_targets), len(OUTCOME_WINDOWS), 4))
+        for i, n in enumerate(self.n_following.tolist()):
+            out[i] = outcome_table(self.next_20[i, :n], cashout_targets)
+        return out
 
 
 @dataclass
@@ -100,180 +259,169 @@ def load_sessions(db_path: str) -> List[SessionData]:
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
     
+    # One scan in session order; sessions without multipliers never appear
     cursor.execute("""
-        SELECT s.id, COUNT(m.id)
-        FROM sessions s
-        LEFT JOIN multipliers m ON s.id = m.session_id
-        GROUP BY s.id
-        ORDER BY s.id ASC
+        SELECT m.session_id, m.multiplier
+        FROM multipliers m
+        JOIN sessions s ON s.id = m.session_id
+        ORDER BY m.session_id ASC, m.id ASC
     """)
-    sessions_info = cursor.fetchall()
     
-    sessions = []
-    for sid, count in sessions_info:
-        if count == 0:
-            continue
-        
-        cursor.execute("""
-            SELECT multiplier FROM multipliers 
-            WHERE session_id = ? 
-            ORDER BY id ASC
-        """, (sid,))
-        mults = [row[0] for row in cursor.fetchall()]
-        
-        sessions.append(SessionData(session_id=sid, multipliers=mults))
+    sessions = [
+        SessionData(session_id=sid, multipliers=[row[1] for row in rows])
+        for sid, rows in itertools.groupby(cursor, key=itemgetter(0))
+    ]
     
     conn.close()
     return sessions
 
 
-def detect_all_signals(sessions: List[SessionData]) -> List[SignalEvent]:
+def detect_all_signals(sessions: List[SessionData], n_jobs: int = 1) -> SignalTable:
     """Detect all signals in historical data and capture what follows."""
-    all_signals = []
+    return SignalTable.concatenate(list(iter_signal_tables(sessions, n_jobs)))
+
+
+def iter_signal_tables(sessions: List[SessionData], n_jobs: int = 1) -> Iterator[SignalTable]:
+    """Yield each session's signals as its own SignalTable, in session order.
     
-    for session in sessions:
-        tracker = HotstreakTracker()
-        mults = session.multipliers
+    Sessions are independent, so with n_jobs > 1 (-1 for every CPU) they are
+    spread over worker processes.  Each worker sends back one SignalTable
+    per session, so this pays off for many long sessions on a multi-core
+    machine.
+    """
+    if n_jobs < 0:
+        n_jobs = os.cpu_count() or 1
+    
+    if n_jobs == 1 or len(sessions) < 2:
+        yield from map(_detect_session_signals, sessions)
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            chunksize = max(1, len(sessions) // (n_jobs * 4))
+            yield from executor.map(_detect_session_signals, sessions, chunksize=chunksize)
+
+
+def _detect_session_signals(session: SessionData) -> SignalTable:
+    """detect_all_signals for one session."""
+    # Parallel columns, one entry per signal
+    rounds, types, at_signal, avgs, stds = [], [], [], [], []
+    
+    tracker = HotstreakTracker()
+    mults = session.multipliers
+    following = np.asarray(mults, dtype=np.float64)
+    
+    # Rolling stats for every full window; entry i - size + 1 is the
+    # window ending at round i
+    stats = precompute_window_stats(following, dtype=np.float64)
+    window_bits = {size: window_stat_bits(stats, size) for size in SIGNAL_WINDOWS}
+    
+    for i, mult in enumerate(mults):
+        tracker.add_multiplier(mult)
         
-        for i, mult in enumerate(mults):
-            tracker.add_multiplier(mult)
-            round_idx = i
-            
-            # Get following multipliers (within same session only)
-            remaining = mults[i + 1:]
-            next_5 = remaining[:5]
-            next_10 = remaining[:10]
-            next_20 = remaining[:20]
-            
-            window_10 = tracker.get_last_n(10)
-            window_15 = tracker.get_last_n(15)
-            
-            # Check hotstreaks
-            if tracker.current_hotstreak:
-                hs = tracker.current_hotstreak
-                if hs.length == HOTSTREAK_MIN_WINDOW:
-                    sig = SignalEvent(
-                        session_id=session.session_id,
-                        round_index=round_idx,
-                        signal_type=f"{hs.type}_hotstreak",
-                        mult_at_signal=mult,
-                        window_avg=hs.average,
-                        window_std=np.std(hs.multipliers) if hs.multipliers else 0,
-                        next_5=next_5,
-                        next_10=next_10,
-                        next_20=next_20,
-                    )
-                    all_signals.append(sig)
-            
-            # Check pattern signals (window 10)
-            if len(window_10) >= 10:
-                signals = analyze_window(window_10, 10)
-                for sig_type in signals:
-                    sig = SignalEvent(
-                        session_id=session.session_id,
-                        round_index=round_idx,
-                        signal_type=f"{sig_type}_w10",
-                        mult_at_signal=mult,
-                        window_avg=np.mean(window_10),
-                        window_std=np.std(window_10),
-                        next_5=next_5,
-                        next_10=next_10,
-                        next_20=next_20,
-                    )
-                    all_signals.append(sig)
-            
-            # Check pattern signals (window 15)
-            if len(window_15) >= 15:
-                signals = analyze_window(window_15, 15)
-                for sig_type in signals:
-                    sig = SignalEvent(
-                        session_id=session.session_id,
-                        round_index=round_idx,
-                        signal_type=f"{sig_type}_w15",
-                        mult_at_signal=mult,
-                        window_avg=np.mean(window_15),
-                        window_std=np.std(window_15),
-                        next_5=next_5,
-                        next_10=next_10,
-                        next_20=next_20,
-                    )
-                    all_signals.append(sig)
-            
-            # Check chain patterns
-            if tracker.just_ended_hotstreak():
-                chain_signals = check_chain_patterns(tracker)
-                for sig_type in chain_signals:
-                    sig = SignalEvent(
-                        session_id=session.session_id,
-                        round_index=round_idx,
-                        signal_type=sig_type,
-                        mult_at_signal=mult,
-                        window_avg=np.mean(window_10) if window_10 else 0,
-                        window_std=np.std(window_10) if window_10 else 0,
-                        next_5=next_5,
-                        next_10=next_10,
-                        next_20=next_20,
-                    )
-                    all_signals.append(sig)
-    
-    return all_signals
-
-
-def analyze_signal_effectiveness(signals: List[SignalEvent], cashout_targets: List[float] = None) -> Dict:
-    """Analyze how effective each signal type is for different cashout targets."""
+        # Check hotstreaks
+        if tracker.current_hotstreak:
+            hs = tracker.current_hotstreak
+            if hs.length == HOTSTREAK_MIN_WINDOW:
+                # The new streak's window is the last 10 rounds
+                rounds.append(i)
+                types.append(_TYPE_IDS[f"{hs.type}_hotstreak"])
+                at_signal.append(mult)
+                avgs.append(hs.average)
+                stds.append(stats["std10"][i - 9])
+        
+        # Check pattern signals (windows 10 and 15)
+        for size in SIGNAL_WINDOWS:
+            j = i - size + 1
+            if j < 0:
+                continue
+            for sig_type in window_signal_names(window_bits[size][j], size):
+                rounds.append(i)
+                types.append(_TYPE_IDS[f"{sig_type}_w{size}"])
+                at_signal.append(mult)
+                avgs.append(stats[f"mean{size}"][j])
+                stds.append(stats[f"std{size}"][j])
+        
+        # Check chain patterns (always at least 10 rounds after a hotstreak)
+        if tracker.just_ended_hotstreak():
+            chain_signals = check_chain_patterns(tracker)
+            for sig_type in chain_signals:
+                rounds.append(i)
+                types.append(_TYPE_IDS[sig_type])
+                at_signal.append(mult)
+                avgs.append(stats["mean10"][i - 9])
+                stds.append(stats["std10"][i - 9])
+
+    return SignalTable.from_session(session.session_id, following, rounds, types, at_signal, avgs, stds)
+
+
+def analyze_signal_effectiveness(signals: Union[SignalTable, Iterable[SignalTable]], cashout_targets: List[float] = None) -> Dict:
+    """Analyze how effective each signal type is for different cashout targets.
+    
+    signals may also be a stream of tables (see iter_signal_tables); totals
+    accumulate table by table, so the full signal set never has to exist.
+    """
     if cashout_targets is None:
         cashout_targets = [2.0, 3.0, 4.0, 5.0]
-    
-    # Group signals by type
-    by_type: Dict[str, List[SignalEvent]] = {}
-    for sig in signals:
-        if sig.signal_type not in by_type:
-            by_type[sig.signal_type] = []
-        by_type[sig.signal_type].append(sig)
+    if isinstance(signals, SignalTable):
+        signals = (signals,)
+    targets = tuple(cashout_targets)
+    sizes = np.array([size for _, size in OUTCOME_WINDOWS])
+    
+    n_types = len(SIGNAL_EVENT_TYPES)
+    counts = np.zeros(n_types, dtype=np.int64)
+    # (type, target, window, [profit, wins, rounds]) running totals
+    sums = np.zeros((n_types, len(targets), len(OUTCOME_WINDOWS), 3))
+    # Type codes in order of first appearance
+    order: Dict[int, None] = {}
+    
+    for table in signals:
+        codes = table.signal_type
+        if not len(codes):
+            continue
+        seen, first = np.unique(codes, return_index=True)
+        order.update(dict.fromkeys(seen[np.argsort(first)].tolist()))
+        counts += np.bincount(codes, minlength=n_types)
+        
+        # (signal, target, window, [profit, wins, max streak, above]), one
+        # martingale pass per signal and target
+        outcomes = table.outcome_tables(targets)
+        values = np.empty((len(table), len(targets), len(OUTCOME_WINDOWS), 3))
+        values[..., :2] = outcomes[..., :2]
+        values[..., 2] = np.minimum(table.n_following[:, None], sizes)[:, None, :]
+        # add.at adds in signal order, like a running +=
+        np.add.at(sums, codes, values)
     
     results = {}
-    
-    for sig_type, type_signals in by_type.items():
-        results[sig_type] = {
-            "count": len(type_signals),
-            "targets": {},
-        }
+    for code in order:
+        count = int(counts[code])
+        results[SIGNAL_EVENT_TYPES[code]] = {"count": count, "targets": {}}
         
-        for target in cashout_targets:
-            target_results = {
-                "next_5": {"total_profit": 0, "total_wins": 0, "total_rounds": 0},
-                "next_10": {"total_profit": 0, "total_wins": 0, "total_rounds": 0},
-                "next_20": {"total_profit": 0, "total_wins": 0, "total_rounds": 0},
-            }
-            
-            for sig in type_signals:
-                outcome = sig.analyze_outcome(target)
-                for window_name in ["next_5", "next_10", "next_20"]:
-                    if window_name in outcome:
-                        o = outcome[window_name]
-                        target_results[window_name]["total_profit"] += o["total_profit"]
-                        target_results[window_name]["total_wins"] += o["wins"]
-                        target_results[window_name]["total_rounds"] += o["rounds"]
-            
-            # Calculate averages
-            for window_name in target_results:
-                tr = target_results[window_name]
-                tr["avg_profit_per_signal"] = tr["total_profit"] / len(type_signals) if type_signals else 0
+        for t, target in enumerate(cashout_targets):
+            target_results = {}
+            for w, (window_name, _) in enumerate(OUTCOME_WINDOWS):
+                profit, wins, rounds = sums[code, t, w].tolist()
+                tr = {
+                    "total_profit": profit,
+                    "total_wins": int(wins),
+                    "total_rounds": int(rounds),
+                }
+                # Calculate averages
+                tr["avg_profit_per_signal"] = tr["total_profit"] / count
                 tr["win_rate"] = tr["total_wins"] / tr["total_rounds"] if tr["total_rounds"] > 0 else 0
+                target_results[window_name] = tr
             
-            results[sig_type]["targets"][target] = target_results
+            results[SIGNAL_EVENT_TYPES[code]]["targets"][target] = target_results
     
     return results
 
 
-def print_signal_report(analysis: Dict, signals: List[SignalEvent]):
+def print_signal_report(analysis: Dict, n_signals: int):
     """Print a detailed report of signal effectiveness."""
     print("\n" + "=" * 100)
     print("SIGNAL EFFECTIVENESS REPORT")
     print("=" * 100)
     
     # Overall stats
-    print(f"\nTotal signals detected: {len(signals)}")
+    print(f"\nTotal signals detected: {n_signals}")
     print("\nSignal frequency:")
     for sig_type in sorted(analysis.keys(), key=lambda x: analysis[x]["count"], reverse=True):
         print(f"  {sig_type}: {analysis[sig_type]['count']}")
@@ -327,37 +475,44 @@ def print_signal_report(analysis: Dict, signals: List[SignalEvent]):
             print("  No consistently profitable signals found")
 
 
-def export_detailed_signals(signals: List[SignalEvent], output_path: str):
-    """Export all signals with their outcomes to JSON for further analysis."""
-    export_data = []
+def _json_line(record: Dict) -> bytes:
+    """One NDJSON line, through orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record, default=lambda o: o.tolist()) + "\n").encode()
+
+
+def export_detailed_signals(signals: SignalTable, output_path: str):
+    """Export all signals with their outcomes for further analysis.
     
-    for sig in signals:
-        outcomes = sig.analyze_outcome(2.0)  # Default to 2x
-        outcomes_3x = sig.analyze_outcome(3.0)
-        outcomes_5x = sig.analyze_outcome(5.0)
-        
-        export_data.append({
-            "session_id": sig.session_id,
-            "round_index": sig.round_index,
-            "signal_type": sig.signal_type,
-            "mult_at_signal": sig.mult_at_signal,
-            "window_avg": sig.window_avg,
-            "window_std": sig.window_std,
-            "next_5": sig.next_5,
-            "next_10": sig.next_10,
-            "next_20": sig.next_20,
-            "outcome_2x": outcomes,
-            "outcome_3x": outcomes_3x,
-            "outcome_5x": outcomes_5x,
-        })
-    
-    with open(output_path, "w") as f:
-        json.dump(export_data, f, indent=2)
+    Written as NDJSON, one signal object per line, as each signal is analyzed.
+    """
+    with open(output_path, "wb") as f:
+        for sig in signals:
+            by_target = sig.analyze_outcomes((2.0, 3.0, 5.0))
+            outcomes = by_target[2.0]  # Default to 2x
+            outcomes_3x = by_target[3.0]
+            outcomes_5x = by_target[5.0]
+            
+            f.write(_json_line({
+                "session_id": sig.session_id,
+                "round_index": sig.round_index,
+                "signal_type": sig.signal_type,
+                "mult_at_signal": sig.mult_at_signal,
+                "window_avg": sig.window_avg,
+                "window_std": sig.window_std,
+                "next_5": sig.next_5,
+                "next_10": sig.next_10,
+                "next_20": sig.next_20,
+                "outcome_2x": outcomes,
+                "outcome_3x": outcomes_3x,
+                "outcome_5x": outcomes_5x,
+            }))
     
     print(f"\nDetailed signal data exported to: {output_path}")
 
 
-def find_optimal_confirmation(signals: List[SignalEvent]) -> Dict:
+def find_optimal_confirmation(signals: SignalTable) -> Dict:
     """
     Find optimal signal confirmation parameters by testing different
     confirmation window sizes and thresholds.
@@ -371,53 +526,40 @@ def find_optimal_confirmation(signals: List[SignalEvent]) -> Dict:
     counts = [2, 3, 4]
     windows = [3, 4, 5, 6]
     
+    # next_10 of every signal, zero-padded; zeros never reach a threshold
+    following = signals.next_20[:, :10]
+    lengths = signals.n_following
+    
+    # hits[t, i, w - 1]: rounds >= thresholds[t] among signal i's first w rounds
+    max_window = max(windows)
+    hits = np.cumsum(following[None, :, :max_window] >= np.asarray(thresholds)[:, None, None], axis=2)
+    above_2x = following >= 2.0
+    
     results = []
     
-    for thresh in thresholds:
+    for t, thresh in enumerate(thresholds):
         for count in counts:
             for window in windows:
                 if count > window:
                     continue
                 
-                # For each signal, check if confirmation would have predicted success
-                predictions = []
-                
-                for sig in signals:
-                    # Check if next_5 would have confirmed
-                    confirm_window = sig.next_5[:window] if len(sig.next_5) >= window else []
-                    if not confirm_window:
-                        continue
-                    
-                    above = sum(1 for m in confirm_window if m >= thresh)
-                    confirmed = above >= count
-                    
-                    # Check if betting after confirmation would succeed (using next rounds after confirmation)
-                    betting_window = sig.next_5[window:] + sig.next_10[5:] if len(sig.next_5) > window else []
-                    if not betting_window:
-                        continue
-                    
-                    # Success = at least one 2x+ in next 5 rounds after confirmation
-                    success = any(m >= 2.0 for m in betting_window[:5])
-                    
-                    predictions.append((confirmed, success))
-                
-                if not predictions:
+                # A signal counts once next_5 covers the confirmation window
+                # and at least one round follows it
+                valid = lengths > window if window < 5 else np.zeros(len(signals), dtype=bool)
+                n_valid = int(valid.sum())
+                if not n_valid:
                     continue
                 
-                # Calculate prediction accuracy
-                confirmed_signals = [p for p in predictions if p[0]]
-                if confirmed_signals:
-                    true_positive = sum(1 for c, s in confirmed_signals if s)
-                    precision = true_positive / len(confirmed_signals)
-                else:
-                    precision = 0
+                confirmed = valid & (hits[t, :, window - 1] >= count)
+                # Success = at least one 2x+ in next 5 rounds after confirmation
+                success = valid & above_2x[:, window:window + 5].any(axis=1)
                 
-                all_success = [p for p in predictions if p[1]]
-                if all_success:
-                    true_positive = sum(1 for c, s in predictions if c and s)
-                    recall = true_positive / len(all_success)
-                else:
-                    recall = 0
+                # Calculate prediction accuracy
+                n_confirmed = int(confirmed.sum())
+                n_success = int(success.sum())
+                true_positive = int((confirmed & success).sum())
+                precision = true_positive / n_confirmed if n_confirmed else 0
+                recall = true_positive / n_success if n_success else 0
                 
                 f1 = 2 * precision * recall / (precision + recall) if (precision + recall) > 0 else 0
                 
@@ -428,7 +570,7 @@ def find_optimal_confirmation(signals: List[SignalEvent]) -> Dict:
                     "precision": precision,
                     "recall": recall,
                     "f1": f1,
-                    "confirmed_count": len(confirmed_signals),
+                    "confirmed_count": n_confirmed,
                 })
     
     # Sort by F1 score
@@ -465,8 +607,9 @@ def get_db_path() -> str:
 def main():
     parser = argparse.ArgumentParser(description="Analyze signal effectiveness")
     parser.add_argument("--db", default=None, help="Path to crasher_data.db")
-    parser.add_argument("--export", default=None, help="Export detailed signals to JSON")
+    parser.add_argument("--export", default=None, help="Export detailed signals to NDJSON (one JSON object per line)")
     parser.add_argument("--confirm-analysis", action="store_true", help="Run confirmation parameter optimization")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes for signal detection (-1 = all CPUs, 1 = serial)")
     args = parser.parse_args()
     
     db_path = args.db or get_db_path()
@@ -485,13 +628,23 @@ def main():
     total_rounds = sum(len(s.multipliers) for s in sessions)
     print(f"Loaded {len(sessions)} sessions with {total_rounds} total rounds")
     
-    print("\nDetecting signals...")
-    signals = detect_all_signals(sessions)
-    print(f"Found {len(signals)} signals")
-    
-    print("\nAnalyzing signal effectiveness...")
-    analysis = analyze_signal_effectiveness(signals)
-    print_signal_report(analysis, signals)
+    if args.confirm_analysis or args.export:
+        print("\nDetecting signals...")
+        signals = detect_all_signals(sessions, n_jobs=args.jobs)
+        n_signals = len(signals)
+        print(f"Found {n_signals} signals")
+        
+        print("\nAnalyzing signal effectiveness...")
+        analysis = analyze_signal_effectiveness(signals)
+    else:
+        # Nothing else needs individual signals, so analyze them as they
+        # are detected
+        print("\nDetecting and analyzing signals...")
+        analysis = analyze_signal_effectiveness(iter_signal_tables(sessions, n_jobs=args.jobs))
+        n_signals = sum(data["count"] for data in analysis.values())
+        print(f"Found {n_signals} signals")
+    
+    print_signal_report(analysis, n_signals)
     
     if args.confirm_analysis:
         find_optimal_confirmation(signals)
@@ -1,7 +1,6 @@
 import glob
 import os
 import sqlite3
-from datetime import datetime
 
 
 def combine_databases_preserve_structure(db_paths, output_db_path="combined.db"):
@@ -19,176 +18,173 @@ def combine_databases_preserve_structure(db_paths, output_db_path="combined.db")
         os.remove(output_db_path)
         print(f"Removed existing database: {output_db_path}")
 
-    # Create new output database with the same structure
-    conn_out = sqlite3.connect(output_db_path)
-    cur_out = conn_out.cursor()
-
-    # Create sessions table with the same structure
-    cur_out.execute("""
-        CREATE TABLE IF NOT EXISTS sessions (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            start_timestamp DATETIME NOT NULL,
-            end_timestamp DATETIME,
-            start_balance REAL,
-            end_balance REAL,
-            total_rounds INTEGER DEFAULT 0,
-            created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-        )
-    """)
-
-    # Create multipliers table with the same structure
-    cur_out.execute("""
-        CREATE TABLE IF NOT EXISTS multipliers (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            multiplier REAL NOT NULL,
-            bettor_count INTEGER,
-            timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-            session_id INTEGER,
-            FOREIGN KEY(session_id) REFERENCES sessions(id)
-        )
-    """)
-
-    # Create index on timestamp for better performance
-    cur_out.execute("CREATE INDEX idx_multipliers_timestamp ON multipliers(timestamp)")
-    cur_out.execute(
-        "CREATE INDEX idx_sessions_start_timestamp ON sessions(start_timestamp)"
-    )
-
-    conn_out.commit()
-
-    # Track ID mappings to maintain referential integrity
-    session_id_map = {}  # Maps old session_id to new session_id
-    all_sessions = []  # Store all sessions with source info for sorting
-    all_multipliers = []  # Store all multipliers with source info for sorting
-
-    # First pass: Collect all data from source databases
-    for db_path in db_paths:
-        if not os.path.exists(db_path):
-            print(f"Warning: Database {db_path} does not exist. Skipping...")
-            continue
-
-        print(f"Reading data from: {db_path}")
-
-        # Connect to source database
-        conn_src = sqlite3.connect(db_path)
-        conn_src.row_factory = sqlite3.Row
-        cur_src = conn_src.cursor()
-
-        try:
-            # Read all sessions
-            cur_src.execute("SELECT * FROM sessions ORDER BY start_timestamp")
-            sessions = cur_src.fetchall()
-
-            for session in sessions:
-                session_dict = dict(session)
-                session_dict["source_db"] = db_path
-                session_dict["original_id"] = session_dict["id"]
-                all_sessions.append(session_dict)
-
-            # Read all multipliers
-            cur_src.execute("SELECT * FROM multipliers ORDER BY timestamp")
-            multipliers = cur_src.fetchall()
-
-            for multiplier in multipliers:
-                multiplier_dict = dict(multiplier)
-                multiplier_dict["source_db"] = db_path
-                multiplier_dict["original_id"] = multiplier_dict["id"]
-                multiplier_dict["original_session_id"] = multiplier_dict["session_id"]
-                all_multipliers.append(multiplier_dict)
-
-        except sqlite3.Error as e:
-            print(f"Error reading from {db_path}: {e}")
-        finally:
-            conn_src.close()
-
-    # Sort sessions by start_timestamp
-    all_sessions.sort(
-        key=lambda x: x["start_timestamp"] if x["start_timestamp"] else datetime.min
-    )
-
-    print(f"\nInserting {len(all_sessions)} sessions in chronological order...")
-
-    # Insert sessions in timestamp order
-    for session in all_sessions:
-        # Remove id and source fields before insertion
-        session_data = {
-            "start_timestamp": session["start_timestamp"],
-            "end_timestamp": session["end_timestamp"],
-            "start_balance": session["start_balance"],
-            "end_balance": session["end_balance"],
-            "total_rounds": session["total_rounds"],
-            "created_at": session["created_at"],
-        }
-
-        cur_out.execute(
-            """
+    # Create new output database with the same structure. Autocommit mode:
+    # the bulk load below runs in one explicit transaction instead of the
+    # driver's implicit ones
+    conn_out = sqlite3.connect(output_db_path, isolation_level=None)
+    try:
+        cur_out = conn_out.cursor()
+
+        # Bulk-load settings: the file is rebuilt from scratch on every run, so
+        # there is nothing for a journal or fsync to protect
+        cur_out.execute("PRAGMA journal_mode=OFF")
+        cur_out.execute("PRAGMA synchronous=OFF")
+        cur_out.execute("PRAGMA temp_store=MEMORY")
+        cur_out.execute("PRAGMA cache_size=-262144")  # 256 MB
+        cur_out.execute("PRAGMA locking_mode=EXCLUSIVE")
+
+        # Create sessions table with the same structure
+        cur_out.execute("""
+            CREATE TABLE IF NOT EXISTS sessions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                start_timestamp DATETIME NOT NULL,
+                end_timestamp DATETIME,
+                start_balance REAL,
+                end_balance REAL,
+                total_rounds INTEGER DEFAULT 0,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
+        # Create multipliers table with the same structure
+        cur_out.execute("""
+            CREATE TABLE IF NOT EXISTS multipliers (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                multiplier REAL NOT NULL,
+                bettor_count INTEGER,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                session_id INTEGER,
+                FOREIGN KEY(session_id) REFERENCES sessions(id)
+            )
+        """)
+
+        # Stage every source's rows in temp tables, tagged with the source's
+        # position so that timestamp ties keep the order the sources came in
+        cur_out.execute("""
+            CREATE TEMP TABLE src_sessions (
+                source INTEGER, id INTEGER, start_timestamp, end_timestamp,
+                start_balance, end_balance, total_rounds, created_at
+            )
+        """)
+        cur_out.execute("""
+            CREATE TEMP TABLE src_multipliers (
+                source INTEGER, id INTEGER, multiplier, bettor_count, timestamp,
+                session_id
+            )
+        """)
+
+        # First pass: Copy all data from source databases inside SQLite
+        for source, db_path in enumerate(db_paths):
+            if not os.path.exists(db_path):
+                print(f"Warning: Database {db_path} does not exist. Skipping...")
+                continue
+
+            print(f"Reading data from: {db_path}")
+
+            attached = False
+            try:
+                # Attach source database
+                cur_out.execute("ATTACH DATABASE ? AS src", (db_path,))
+                attached = True
+                cur_out.execute("BEGIN")
+                cur_out.execute(
+                    """
+                    INSERT INTO src_sessions
+                    SELECT ?, id, start_timestamp, end_timestamp, start_balance,
+                           end_balance, total_rounds, created_at
+                    FROM src.sessions
+                """,
+                    (source,),
+                )
+                cur_out.execute(
+                    """
+                    INSERT INTO src_multipliers
+                    SELECT ?, id, multiplier, bettor_count, timestamp, session_id
+                    FROM src.multipliers
+                """,
+                    (source,),
+                )
+                cur_out.execute("COMMIT")
+            except sqlite3.Error as e:
+                print(f"Error reading from {db_path}: {e}")
+                if conn_out.in_transaction:
+                    cur_out.execute("ROLLBACK")
+            finally:
+                if attached:
+                    cur_out.execute("DETACH DATABASE src")
+
+        # New session ids follow start_timestamp order; the map keeps
+        # multipliers pointing at their session. Timestamps are ISO-8601 text
+        # (sqlite3's datetime adapter and CURRENT_TIMESTAMP both write
+        # "YYYY-MM-DD HH:MM:SS[.ffffff]"), which sorts chronologically as plain
+        # bytes, so nothing is parsed to order them
+        cur_out.execute("""
+            CREATE TEMP TABLE session_map (
+                source INTEGER, old_id INTEGER, new_id INTEGER,
+                PRIMARY KEY (source, old_id)
+            ) WITHOUT ROWID
+        """)
+        cur_out.execute("""
+            INSERT INTO session_map
+            SELECT source, id,
+                   ROW_NUMBER() OVER (ORDER BY start_timestamp, source, id)
+            FROM src_sessions
+        """)
+
+        session_count = cur_out.execute(
+            "SELECT COUNT(*) FROM src_sessions"
+        ).fetchone()[0]
+        print(f"\nInserting {session_count} sessions in chronological order...")
+
+        cur_out.execute("BEGIN")
+
+        # Insert sessions in timestamp order
+        cur_out.execute("""
             INSERT INTO sessions (
-                start_timestamp, end_timestamp, start_balance,
+                id, start_timestamp, end_timestamp, start_balance,
                 end_balance, total_rounds, created_at
-            ) VALUES (
-                :start_timestamp, :end_timestamp, :start_balance,
-                :end_balance, :total_rounds, :created_at
             )
-        """,
-            session_data,
-        )
-
-        # Store the mapping from original session_id to new session_id
-        new_session_id = cur_out.lastrowid
-        session_id_map[(session["source_db"], session["original_id"])] = new_session_id
-
-    conn_out.commit()
-
-    # Sort multipliers by timestamp
-    all_multipliers.sort(
-        key=lambda x: x["timestamp"] if x["timestamp"] else datetime.min
-    )
-
-    print(f"Inserting {len(all_multipliers)} multipliers in chronological order...")
-
-    # Insert multipliers in timestamp order with updated session_id references
-    multipliers_inserted = 0
-    for multiplier in all_multipliers:
-        # Get the new session_id from the mapping
-        new_session_id = session_id_map.get(
-            (multiplier["source_db"], multiplier["original_session_id"]), None
+            SELECT m.new_id, s.start_timestamp, s.end_timestamp, s.start_balance,
+                   s.end_balance, s.total_rounds, s.created_at
+            FROM src_sessions s
+            JOIN session_map m ON m.source = s.source AND m.old_id = s.id
+            ORDER BY m.new_id
+        """)
+
+        multiplier_count = cur_out.execute(
+            "SELECT COUNT(*) FROM src_multipliers"
+        ).fetchone()[0]
+        print(f"Inserting {multiplier_count} multipliers in chronological order...")
+
+        # Insert multipliers in timestamp order with updated session_id references
+        cur_out.execute("""
+            INSERT INTO multipliers (multiplier, bettor_count, timestamp, session_id)
+            SELECT m.multiplier, m.bettor_count, m.timestamp, s.new_id
+            FROM src_multipliers m
+            LEFT JOIN session_map s
+                ON s.source = m.source AND s.old_id = m.session_id
+            ORDER BY m.timestamp, m.source, m.id
+        """)
+
+        # Create index on timestamp for better performance; building them once
+        # the tables are full is cheaper than updating them on every insert
+        cur_out.execute(
+            "CREATE INDEX idx_multipliers_timestamp ON multipliers(timestamp)"
         )
-
-        # Remove id and source fields before insertion
-        multiplier_data = {
-            "multiplier": multiplier["multiplier"],
-            "bettor_count": multiplier["bettor_count"],
-            "timestamp": multiplier["timestamp"],
-            "session_id": new_session_id,
-        }
-
         cur_out.execute(
-            """
-            INSERT INTO multipliers (
-                multiplier, bettor_count, timestamp, session_id
-            ) VALUES (
-                :multiplier, :bettor_count, :timestamp, :session_id
-            )
-        """,
-            multiplier_data,
+            "CREATE INDEX idx_sessions_start_timestamp ON sessions(start_timestamp)"
         )
 
-        multipliers_inserted += 1
-
-        # Commit every 1000 inserts for better performance
-        if multipliers_inserted % 1000 == 0:
-            conn_out.commit()
-            print(f"  Inserted {multipliers_inserted} multipliers...")
-
-    conn_out.commit()
-    conn_out.close()
+        cur_out.execute("COMMIT")
+    finally:
+        conn_out.close()
 
     print(f"\n{'=' * 60}")
     print(f"COMBINATION COMPLETE")
     print(f"{'=' * 60}")
     print(f"Output database: {output_db_path}")
-    print(f"Sessions inserted: {len(all_sessions)}")
-    print(f"Multipliers inserted: {len(all_multipliers)}")
+    print(f"Sessions inserted: {session_count}")
+    print(f"Multipliers inserted: {multiplier_count}")
     print(f"Source databases processed: {len(db_paths)}")
 
 
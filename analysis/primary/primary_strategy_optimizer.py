@@ -38,27 +38,78 @@ Usage
     python primary_strategy_optimizer.py --bank 1000000 --multipliers 2,3,4,5
     python primary_strategy_optimizer.py --bank 2600000 --top 5 --export
     python primary_strategy_optimizer.py --bank 2600000 --min-fired 10
+    python primary_strategy_optimizer.py --bank 2600000 --jobs -1
 """
 
 import argparse
 import json
 import math
+import os
 import sqlite3
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from itertools import chain, repeat
+from multiprocessing.shared_memory import SharedMemory
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # optional: the kernels below then run as plain Python
+    njit = None
+    prange = range
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; JSON output falls back to json
+    orjson = None
+
+
+def _jit(fn=None, **options):
+    """njit(cache=True, **options) when numba is installed, else fn unchanged."""
+    if fn is None:
+        return lambda f: _jit(f, **options)
+    return njit(cache=True, **options)(fn) if njit else fn
+
 
 # ─────────────────────────────────────────────────────────────
 # DATA LOADING
 # ─────────────────────────────────────────────────────────────
 
 
-def load_multipliers(db_path: str) -> List[float]:
+def load_multipliers(db_path: str, use_cache: bool = True) -> np.ndarray:
+    """
+    Round history as a float32 array, in id order.
+
+    Multipliers have two decimals, so float32 keeps them distinct and in
+    order against every threshold, provided thresholds are float32 too.
+
+    The array is cached next to the database as <db>.mults.npy and reused
+    until the database (or its WAL file) is modified again.
+    """
+    cache_path = Path(db_path + ".mults.npy")
+    db_mtime = max(
+        p.stat().st_mtime for p in (Path(db_path), Path(db_path + "-wal")) if p.exists()
+    )
+    if use_cache and cache_path.exists() and cache_path.stat().st_mtime > db_mtime:
+        return np.load(cache_path).astype(np.float32, copy=False)
+
     conn = sqlite3.connect(db_path)
     cur = conn.cursor()
     cur.execute("SELECT multiplier FROM multipliers ORDER BY id ASC")
-    mults = [row[0] for row in cur.fetchall()]
+    # Stream the one-column rows straight into the array, with no
+    # intermediate list of rows or floats
+    mults = np.fromiter(chain.from_iterable(cur), dtype=np.float32)
     conn.close()
+
+    if use_cache:
+        try:
+            np.save(cache_path, mults)
+        except OSError:
+            pass  # read-only location: just load from the database next time
     return mults
 
 
@@ -67,22 +118,18 @@ def load_multipliers(db_path: str) -> List[float]:
 # ─────────────────────────────────────────────────────────────
 
 
-def streak_stats(mults: List[float], threshold: float) -> dict:
+def streak_stats(mults: Sequence[float], threshold: float) -> dict:
     """Count / percentile stats for consecutive runs under threshold."""
-    lengths, current = [], 0
-    for m in mults:
-        if m < threshold:
-            current += 1
-        else:
-            if current:
-                lengths.append(current)
-            current = 0
-    if current:
-        lengths.append(current)
-
-    if not lengths:
+    # Runs start where the under-threshold mask turns on and end where it
+    # turns off; padding closes a run still open at either end
+    mults = np.asarray(mults)
+    under = mults < mults.dtype.type(threshold)
+    edges = np.diff(under.astype(np.int8), prepend=0, append=0)
+    lengths = np.flatnonzero(edges == -1) - np.flatnonzero(edges == 1)
+
+    if not len(lengths):
         return {"count": 0, "mean": 0.0, "p90": 0, "p95": 0, "p99": 0, "max": 0}
-    s = sorted(lengths)
+    s = np.sort(lengths).tolist()
     n = len(s)
     return {
         "count": n,
@@ -104,25 +151,45 @@ def bet_mult_for(cashout: float) -> float:
     return cashout / (cashout - 1)
 
 
-def geo_sum(base: float, ratio: float, n: int) -> float:
-    """Total cost of n consecutive martingale bets: base*(ratio^n-1)/(ratio-1)."""
+def geo_sum(base: float, ratio: float, n: int, ratio_n: Optional[float] = None) -> float:
+    """
+    Total cost of n consecutive martingale bets: base*(ratio^n-1)/(ratio-1).
+    ratio_n, if given, is ratio^n from power_table.
+    """
     if ratio == 1.0:
         return base * n
-    return base * (ratio**n - 1) / (ratio - 1)
+    if ratio_n is None:
+        ratio_n = ratio**n
+    return base * (ratio_n - 1) / (ratio - 1)
+
+
+@_jit
+def power_table(bm: float, n: int) -> np.ndarray:
+    """bm^k for k = 0..n, each the same value bm**k gives."""
+    out = np.empty(n + 1)
+    for k in range(n + 1):
+        # float exponent: numba expands integer powers into multiplications
+        out[k] = bm ** float(k)
+    return out
 
 
-def base_bet_exact(bank: float, bm: float, n: int) -> float:
+@_jit
+def base_bet_exact(bank: float, bm: float, n: int, bm_n: float = -1.0) -> float:
     """
     Largest base_bet so that losing n consecutive martingale bets costs exactly bank.
     Inverse of geo_sum: base = bank * (bm-1) / (bm^n - 1)
+    bm_n, if given, is bm^n from power_table.
     """
     if n <= 0:
         return bank
     if bm == 1.0:
         return bank / n
-    return bank * (bm - 1) / (bm**n - 1)
+    if bm_n < 0:
+        bm_n = bm ** float(n)
+    return bank * (bm - 1) / (bm_n - 1)
 
 
+@_jit
 def round_down_to_step(value: float, min_bet: float) -> float:
     """
     Round value DOWN to the nearest clean increment, then enforce min_bet floor.
@@ -143,8 +210,29 @@ def round_down_to_step(value: float, min_bet: float) -> float:
     return max(min_bet, float(rounded))
 
 
+@_jit
+def round_down_to_steps(values: np.ndarray, min_bet: float) -> np.ndarray:
+    """round_down_to_step for a whole array, picking every step in one pass."""
+    steps = np.where(
+        values >= 10_000,
+        500.0,
+        np.where(values >= 1_000, 250.0, np.where(values >= 100, 50.0, 10.0)),
+    )
+    return np.maximum(min_bet, np.floor(values / steps) * steps)
+
+
+@_jit
 def rounds_covered(bank: float, base: float, bm: float) -> int:
     """How many consecutive martingale losses fit inside bank at this base_bet?"""
+    # Closed form: the largest n with base*(bm^n - 1)/(bm - 1) <= bank. It
+    # is trusted only when it lands clear of an integer; at a boundary the
+    # answer depends on how the running total of the bets rounds, so the
+    # bets are added up as they would be placed
+    if bm > 1.0 and base > 0.0 and bank >= base:
+        x = math.log1p(bank * (bm - 1.0) / base) / math.log(bm)
+        frac = x - math.floor(x)
+        if 1e-9 < frac < 1.0 - 1e-9:
+            return int(math.floor(x))
     total, n, bet = 0.0, 0, base
     while total + bet <= bank:
         total += bet
@@ -159,7 +247,7 @@ def rounds_covered(bank: float, base: float, bm: float) -> int:
 
 
 def simulate(
-    mults: List[float],
+    mults: Sequence[float],
     cashout: float,
     threshold: float,
     trigger_count: int,
@@ -182,49 +270,249 @@ def simulate(
         - Exhaust max_mr without a win: bust; profit -= losses_so_far; streak resets.
     * Rounds consumed during a martingale sequence do NOT count towards the next streak.
     """
+    runs = round_runs(*round_masks(np.asarray(mults), cashout, threshold))
+    if njit is None:
+        runs = tuple(column.tolist() for column in runs)
+    return simulate_runs(*runs, cashout, trigger_count, base_bet, bet_mult, max_mr)
+
+
+def round_masks(
+    mults: np.ndarray, cashout: float, threshold: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    (under, wins): which rounds are < threshold and which are >= cashout.
+
+    Both are compared in the history's own precision.
+    """
+    under = mults < mults.dtype.type(threshold)
+    wins = mults >= mults.dtype.type(cashout)
+    return under, wins
+
+
+def round_runs(
+    under: np.ndarray, wins: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Index the round masks once per cashout for simulate_runs.
+
+    Returns (run_starts, run_lengths, next_win, run_left):
+      run_starts / run_lengths  every run of consecutive under-threshold rounds
+      next_win[i]               first winning round at or after i (n if none)
+      run_left[i]               under-threshold rounds from i up to the next
+                                round that is not
+    next_win and run_left have n + 1 entries, so i = n is valid.
+    """
+    n = len(under)
+    index = np.arange(n + 1)
+    edges = np.diff(under.astype(np.int8), prepend=0, append=0)
+    run_starts = np.flatnonzero(edges == 1)
+    run_lengths = np.flatnonzero(edges == -1) - run_starts
+
+    def next_marked(marks: np.ndarray) -> np.ndarray:
+        marked = np.where(np.append(marks, True), index, n)
+        return np.minimum.accumulate(marked[::-1])[::-1]
+
+    next_win = next_marked(wins)
+    run_left = next_marked(~under) - index
+    return run_starts, run_lengths, next_win, run_left
+
+
+@_jit
+def simulate_runs(
+    run_starts: Sequence[int],
+    run_lengths: Sequence[int],
+    next_win: Sequence[int],
+    run_left: Sequence[int],
+    cashout: float,
+    trigger_count: int,
+    base_bet: float,
+    bet_mult: float,
+    max_mr: int,
+) -> Tuple[float, int, int]:
+    """
+    simulate over precomputed round_runs, so the history is scanned once
+    per cashout rather than once per trigger_count: each trigger is found
+    from the run index and each martingale resolves with one next_win lookup.
+    """
+    # The martingale ladder is the same for every sequence: what a win at
+    # step k pays and what losing the first k bets costs, accumulated in
+    # the order the bets are placed
+    win_payout = np.empty(max_mr)
+    lost_after = np.empty(max_mr + 1)
+    bet = base_bet
+    lost_so_far = 0.0
+    for k in range(max_mr):
+        lost_after[k] = lost_so_far
+        win_payout[k] = bet * (cashout - 1) - lost_so_far
+        lost_so_far += bet
+        bet *= bet_mult
+    lost_after[max_mr] = lost_so_far
+
     total_profit = 0.0
     total_fired = 0
     busts = 0
-    streak = 0
-    i = 0
-    n = len(mults)
-
-    while i < n:
-        m = mults[i]
-        if m < threshold:
-            streak += 1
+    n = len(next_win) - 1
+    n_runs = len(run_starts)
+    run = 0
+    i = 0  # next round to scan; the streak restarts from 0 here
+
+    while True:
+        # Round on which the streak reaches trigger_count: inside the run
+        # i is in, if it is long enough, else in the first later run that is
+        if trigger_count <= 0:
+            fire = i + run_left[i]
+            if fire >= n:
+                break
+        elif run_left[i] >= trigger_count:
+            fire = i + trigger_count - 1
         else:
-            streak = 0
-        i += 1
-
-        if streak == trigger_count:
-            # Trigger fires
-            total_fired += 1
-            bet = base_bet
-            lost_so_far = 0.0
-            won = False
-
-            for _ in range(max_mr):
-                if i >= n:
-                    break
-                m2 = mults[i]
-                i += 1
-
-                if m2 >= cashout:
-                    total_profit += bet * (cashout - 1) - lost_so_far
-                    won = True
-                    streak = 0
-                    break
-                else:
-                    lost_so_far += bet
-                    bet *= bet_mult
+            after = i + run_left[i]
+            while run < n_runs and (
+                run_starts[run] < after or run_lengths[run] < trigger_count
+            ):
+                run += 1
+            if run == n_runs:
+                break
+            fire = run_starts[run] + trigger_count - 1
+
+        # Trigger fires: the martingale bets from the next round on
+        total_fired += 1
+        i = fire + 1
+        k = next_win[i] - i
+        if k < max_mr and i + k < n:
+            total_profit += win_payout[k]
+            i += k + 1
+        else:
+            k = min(max_mr, n - i)
+            total_profit -= lost_after[k]
+            busts += 1
+            i += k
+
+    return float(total_profit), total_fired, busts
+
+
+@_jit
+def size_trigger_counts(
+    bank: float,
+    bm: float,
+    min_bet: float,
+    max_base: float,
+    fixed_mr: bool,
+    tc_start: int,
+    tc_stop: int,
+    rounds_to_cover: int,
+    pow_bm: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    req_mr and base_bet for every trigger_count in [tc_start, tc_stop)
+    (see optimize_one for the two modes).
+    pow_bm is power_table(bm, n) for some n >= rounds_to_cover.
+    """
+    n = max(tc_stop - tc_start, 0)
+    req_mrs = np.empty(n, dtype=np.int64)
+    exact_bases = np.empty(n)
+    for k in range(n):
+        tc = tc_start + k
+        if fixed_mr:
+            req_mrs[k] = tc
+            m = rounds_to_cover - tc
+            exact_bases[k] = base_bet_exact(bank, bm, m, pow_bm[m])
+        else:
+            req_mrs[k] = tc + 1
+            exact_bases[k] = min(
+                base_bet_exact(bank, bm, tc + 1, pow_bm[tc + 1]), max_base
+            )
+    return req_mrs, round_down_to_steps(exact_bases, min_bet)
 
-            if not won:
-                total_profit -= lost_so_far
-                busts += 1
-                streak = 0
 
-    return total_profit, total_fired, busts
+@_jit
+def _eval_tc(
+    run_starts: Sequence[int],
+    run_lengths: Sequence[int],
+    next_win: Sequence[int],
+    run_left: Sequence[int],
+    cashout: float,
+    tc: int,
+    base_bet: float,
+    bank: float,
+    bm: float,
+) -> Tuple[int, float, int, int]:
+    """
+    Simulate one sized trigger_count.
+
+    Returns (actual_mr, profit, fired, busts).
+    """
+    actual_mr = rounds_covered(bank, base_bet, bm)
+    profit, fired, busts = simulate_runs(
+        run_starts,
+        run_lengths,
+        next_win,
+        run_left,
+        cashout,
+        tc,
+        base_bet,
+        bm,
+        actual_mr,
+    )
+    return actual_mr, profit, fired, busts
+
+
+@_jit(parallel=True)
+def sweep_trigger_counts(
+    run_starts: Sequence[int],
+    run_lengths: Sequence[int],
+    next_win: Sequence[int],
+    run_left: Sequence[int],
+    cashout: float,
+    bank: float,
+    bm: float,
+    min_bet: float,
+    max_base: float,
+    fixed_mr: bool,
+    tc_start: int,
+    tc_stop: int,
+    rounds_to_cover: int,
+    pow_bm: np.ndarray,
+):
+    """
+    _eval_tc for every trigger_count in [tc_start, tc_stop).
+    pow_bm is power_table(bm, n) for some n >= rounds_to_cover.
+
+    The trigger counts are independent, so numba spreads them over threads.
+    Returns arrays (base_bet, req_mr, actual_mr, profit, fired, busts)
+    indexed by trigger_count - tc_start.
+    """
+    req_mrs, base_bets = size_trigger_counts(
+        bank,
+        bm,
+        min_bet,
+        max_base,
+        fixed_mr,
+        tc_start,
+        tc_stop,
+        rounds_to_cover,
+        pow_bm,
+    )
+    n = len(base_bets)
+    actual_mrs = np.empty(n, dtype=np.int64)
+    profits = np.empty(n)
+    fired = np.empty(n, dtype=np.int64)
+    busts = np.empty(n, dtype=np.int64)
+
+    for k in prange(n):
+        actual_mrs[k], profits[k], fired[k], busts[k] = _eval_tc(
+            run_starts,
+            run_lengths,
+            next_win,
+            run_left,
+            cashout,
+            tc_start + k,
+            base_bets[k],
+            bank,
+            bm,
+        )
+
+    return base_bets, req_mrs, actual_mrs, profits, fired, busts
 
 
 # ─────────────────────────────────────────────────────────────
@@ -233,7 +521,7 @@ def simulate(
 
 
 def optimize_one(
-    mults: List[float],
+    mults: np.ndarray,
     cashout: int,
     bank: float,
     min_bet: float,
@@ -241,6 +529,8 @@ def optimize_one(
     top_n: int,
     mr_factor: Optional[int] = None,
     min_fired: int = 1,
+    ss: Optional[dict] = None,
+    patience: int = 0,
 ) -> dict:
     """
     Search all valid trigger_count values for this cashout multiplier.
@@ -270,11 +560,18 @@ def optimize_one(
     min_fired filters out configs that triggered fewer than this many times
     in the full history (avoids recommending strategies that barely activated).
 
+    ss is this cashout's streak_stats, if the caller already has it.
+
+    patience > 0 stops the search once that many consecutive trigger_counts
+    fail to beat the best profit seen so far (profit is usually unimodal in
+    trigger_count). The default 0 searches every trigger_count.
+
     Returns a dict with 'best' config and 'all_viable' sorted by profit.
     """
     threshold = cashout + 0.01
     bm = bet_mult_for(float(cashout))
-    ss = streak_stats(mults, threshold)
+    if ss is None:
+        ss = streak_stats(mults, threshold)
     max_streak = ss["max"]
 
     meta: dict = {
@@ -295,7 +592,6 @@ def optimize_one(
         }
 
     n_rounds = len(mults)
-    viable = []
     rounds_to_cover = max_streak + 1
     min_trigger_count = rounds_covered(bank, min_bet, bm)
 
@@ -303,24 +599,74 @@ def optimize_one(
     if mr_factor is not None:
         rounds_to_cover = cashout * mr_factor
 
-    for tc in range(min_trigger_count, rounds_to_cover):
-        if mr_factor is not None:
-            req_mr = tc
-            exact_base = base_bet_exact(bank, bm, rounds_to_cover - tc)
-            base_bet = round_down_to_step(exact_base, min_bet)
-            actual_mr = rounds_covered(bank, base_bet, bm)
+    # bm^k for every streak length the sweep and the entries below use;
+    # bets are at least min_bet, so no actual_mr exceeds min_trigger_count
+    pow_bm = power_table(bm, max(rounds_to_cover, min_trigger_count))
+
+    runs = round_runs(*round_masks(mults, float(cashout), threshold))
+    if njit is None:
+        runs = tuple(column.tolist() for column in runs)
+
+    # Sweep in blocks of `patience` trigger counts so an early stop skips
+    # the rest of the range; one block covers everything when exhaustive
+    block = patience if patience > 0 else max(rounds_to_cover - min_trigger_count, 0)
+    blocks = []
+    n_swept = 0
+    best_profit = -math.inf
+    since_best = 0
+    tc_start = min_trigger_count
+    while tc_start < rounds_to_cover and since_best < max(patience, 1):
+        tc_stop = min(tc_start + block, rounds_to_cover)
+        sweep = sweep_trigger_counts(
+            *runs,
+            float(cashout),
+            bank,
+            bm,
+            min_bet,
+            bank * max_base_pct / 100.0,
+            mr_factor is not None,
+            tc_start,
+            tc_stop,
+            rounds_to_cover,
+            pow_bm,
+        )
+        blocks.append(sweep)
+        if patience <= 0:
+            n_swept += tc_stop - tc_start
         else:
-            req_mr = tc + 1
-            max_base = bank * max_base_pct / 100.0
-            exact_base = min(base_bet_exact(bank, bm, req_mr), max_base)
-            base_bet = round_down_to_step(exact_base, min_bet)
-            actual_mr = rounds_covered(bank, base_bet, bm)
-
-        profit, fired, busts = simulate(
-            mults, float(cashout), threshold, tc, base_bet, bm, actual_mr
+            for profit in sweep[3].tolist():
+                n_swept += 1
+                if profit > best_profit:
+                    best_profit, since_best = profit, 0
+                else:
+                    since_best += 1
+                    if since_best >= patience:
+                        break
+        tc_start = tc_stop
+    pow_bm = pow_bm.tolist()
+
+    # Keep the bust-free configs that fired often enough, ranked by their
+    # rounded profit; only the ones returned are built into dicts below
+    viable = []
+    if blocks:
+        columns = [np.concatenate(column)[:n_swept] for column in zip(*blocks)]
+        fired, busts = columns[4], columns[5]
+        keep = np.flatnonzero((busts == 0) & (fired >= min_fired))
+        viable = list(
+            zip(
+                (min_trigger_count + keep).tolist(),
+                *(column[keep].tolist() for column in columns),
+            )
         )
+    # Sort by total simulated profit (descending)
+    viable.sort(key=lambda row: round(row[4], 2), reverse=True)
 
-        entry = {
+    def entry(row: tuple) -> dict:
+        tc, base_bet, req_mr, actual_mr, profit, fired, busts = row
+        if base_bet == min_bet:
+            base_bet = min_bet  # floored bets keep min_bet's type, as max() did
+        worst_cost = geo_sum(base_bet, bm, actual_mr, pow_bm[actual_mr])
+        return {
             "trigger_count": tc,
             "base_bet": base_bet,
             "req_mr": req_mr,
@@ -330,17 +676,17 @@ def optimize_one(
             "profit": round(profit, 2),
             "profit_per_1k": round(profit * 1000 / n_rounds, 2),
             "profit_per_fire": round(profit / fired, 2) if fired else 0.0,
-            "worst_cost": round(geo_sum(base_bet, bm, actual_mr), 2),
-            "bank_pct": round(geo_sum(base_bet, bm, actual_mr) / bank * 100, 2),
+            "worst_cost": round(worst_cost, 2),
+            "bank_pct": round(worst_cost / bank * 100, 2),
             "profit_per_win": round(base_bet * (float(cashout) - 1), 2),
         }
 
-        if busts == 0 and fired >= min_fired:
-            viable.append(entry)
-
-    # Sort by total simulated profit (descending)
-    viable.sort(key=lambda x: x["profit"], reverse=True)
-    best = viable[0] if viable else None
+    # best is the same dict as its all_viable row; the report marks it by identity
+    shown = [entry(row) for row in viable[:top_n]]
+    if shown:
+        best = shown[0]
+    else:
+        best = entry(viable[0]) if viable else None
 
     return {
         "cashout": cashout,
@@ -348,17 +694,35 @@ def optimize_one(
         "max_streak": max_streak,
         "streak_stats": ss,
         "best": best,
-        "all_viable": viable[:top_n],
+        "all_viable": shown,
         **meta,
     }
 
 
+# Worker processes' view of the round history, attached once per worker
+# by _attach_mults rather than pickled with every task
+_MULTS: Optional[np.ndarray] = None
+_MULTS_SHM: Optional[SharedMemory] = None
+
+
+def _attach_mults(name: str, shape: Tuple[int, ...], dtype: str):
+    """ProcessPoolExecutor initializer: map the parent's shared round history."""
+    global _MULTS, _MULTS_SHM
+    _MULTS_SHM = SharedMemory(name=name)
+    _MULTS = np.ndarray(shape, dtype=dtype, buffer=_MULTS_SHM.buf)
+
+
+def _optimize_shared(*args) -> dict:
+    """optimize_one on the history _attach_mults mapped into this worker."""
+    return optimize_one(_MULTS, *args)
+
+
 # ─────────────────────────────────────────────────────────────
 # OUTPUT
 # ─────────────────────────────────────────────────────────────
 
 
-def print_streak_table(mults: List[float], cashout_list: List[int]):
+def print_streak_table(streaks: Dict[int, dict], cashout_list: List[int]):
     print()
     print("=" * 76)
     print("  HISTORICAL STREAK SUMMARY  (consecutive rounds UNDER threshold)")
@@ -369,7 +733,7 @@ def print_streak_table(mults: List[float], cashout_list: List[int]):
     )
     print(f"  {'─' * 72}")
     for co in cashout_list:
-        ss = streak_stats(mults, co + 0.01)
+        ss = streaks[co]
         print(
             f"  {co:>5}x  {co + 0.01:>7.2f}  {ss['count']:>6}  "
             f"{ss['mean']:>6.1f}  {ss['p90']:>5}  {ss['p95']:>5}  "
@@ -469,6 +833,13 @@ def print_alternatives(results: List[dict]):
         print()
 
 
+def to_json(obj) -> str:
+    """obj as JSON indented by 2, through orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
 def export_configs(results: List[dict], bank: float, path: str):
     strategies = []
     for r in results:
@@ -497,7 +868,7 @@ def export_configs(results: List[dict], bank: float, path: str):
         "strategies": strategies,
     }
     with open(path, "w") as f:
-        json.dump(out, f, indent=2)
+        f.write(to_json(out))
     print(f"Exported {len(strategies)} strategies -> {path}")
 
 
@@ -530,6 +901,11 @@ def main():
         help="Your total bank/balance (e.g. 2600000)",
     )
     parser.add_argument("--db", default=None, help="Path to crasher_data.db")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Read the database directly instead of its <db>.mults.npy cache",
+    )
     parser.add_argument(
         "--min-bet",
         type=float,
@@ -571,6 +947,21 @@ def main():
         help="Comma-separated cashout multipliers "
         "(default: 2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20)",
     )
+    parser.add_argument(
+        "--patience",
+        type=int,
+        default=0,
+        help="Stop a multiplier's trigger-count search after this many "
+        "consecutive trigger counts without a new best profit "
+        "(default: 0 = search them all)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for the per-multiplier search "
+        "(-1 = all CPUs, default: 1)",
+    )
     parser.add_argument(
         "--top",
         type=int,
@@ -610,13 +1001,15 @@ def main():
         sys.exit(1)
 
     print(f"Loading multiplier history from: {db_path}")
-    mults = load_multipliers(db_path)
-    if not mults:
+    mults = load_multipliers(db_path, use_cache=not args.no_cache)
+    if not len(mults):
         print("ERROR: No multiplier data found in database.")
         sys.exit(1)
     print(f"Loaded {len(mults):,} rounds.\n")
 
-    print_streak_table(mults, cashout_list)
+    # Streak stats per multiplier, shared by the table and the optimizer
+    streaks = {co: streak_stats(mults, co + 0.01) for co in cashout_list}
+    print_streak_table(streaks, cashout_list)
 
     if args.streaks_only:
         return
@@ -638,31 +1031,55 @@ def main():
         f"multipliers={cashout_list[0]}x-{cashout_list[-1]}x\n"
     )
 
+    # Multipliers are independent; with --jobs they run in worker processes
+    # and come back in order, so progress prints as each one finishes
+    n_jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    optimize_args = (
+        cashout_list,
+        repeat(args.bank),
+        repeat(args.min_bet),
+        repeat(args.max_base_pct),
+        repeat(args.top),
+        repeat(args.mr_factor),
+        repeat(args.min_fired),
+        [streaks[co] for co in cashout_list],
+        repeat(args.patience),
+    )
+
     results = []
-    for co in cashout_list:
-        sys.stdout.write(f"  Optimising {co}x ... ")
-        sys.stdout.flush()
-        r = optimize_one(
-            mults,
-            co,
-            args.bank,
-            args.min_bet,
-            args.max_base_pct,
-            args.top,
-            mr_factor=args.mr_factor,
-            min_fired=args.min_fired,
-        )
-        b = r["best"]
-        if b:
-            sys.stdout.write(
-                f"best tc={b['trigger_count']:>3}  "
-                f"base_bet={b['base_bet']:>10,.0f}  "
-                f"fired={b['fired']:>5}  "
-                f"profit={b['profit']:>12,.0f}\n"
+    with ExitStack() as stack:
+        if n_jobs > 1:
+            # Workers map the history from shared memory instead of
+            # receiving a pickled copy with every multiplier
+            shm = SharedMemory(create=True, size=mults.nbytes)
+            stack.callback(shm.unlink)
+            stack.callback(shm.close)
+            np.ndarray(mults.shape, dtype=mults.dtype, buffer=shm.buf)[:] = mults
+            executor = stack.enter_context(
+                ProcessPoolExecutor(
+                    max_workers=n_jobs,
+                    initializer=_attach_mults,
+                    initargs=(shm.name, mults.shape, mults.dtype.str),
+                )
             )
+            optimized = executor.map(_optimize_shared, *optimize_args)
         else:
-            sys.stdout.write("no viable config found\n")
-        results.append(r)
+            optimized = map(optimize_one, repeat(mults), *optimize_args)
+        for co in cashout_list:
+            sys.stdout.write(f"  Optimising {co}x ... ")
+            sys.stdout.flush()
+            r = next(optimized)
+            b = r["best"]
+            if b:
+                sys.stdout.write(
+                    f"best tc={b['trigger_count']:>3}  "
+                    f"base_bet={b['base_bet']:>10,.0f}  "
+                    f"fired={b['fired']:>5}  "
+                    f"profit={b['profit']:>12,.0f}\n"
+                )
+            else:
+                sys.stdout.write("no viable config found\n")
+            results.append(r)
 
     print_summary_table(results, bank=args.bank)
 
@@ -702,7 +1119,7 @@ def main():
                 "enabled": True,
             }
         )
-    print(json.dumps(strategies_json, indent=2))
+    print(to_json(strategies_json))
 
 
 if __name__ == "__main__":
@@ -3,9 +3,10 @@
 import multiprocessing
 import sys
 
-if __name__ == "__main__":
-    multiprocessing.freeze_support()
 
+def main():
+    # Logging, config and engine are imported here rather than at module
+    # level, so importing crasher_bot.cli stays cheap
     import logging
 
     logging.basicConfig(
@@ -33,3 +34,11 @@ if __name__ == "__main__":
     except FileNotFoundError:
         print(f"Config file not found: {config_path}")
         sys.exit(1)
+    except ValueError as e:
+        print(f"Invalid config: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    main()
@@ -1,20 +1,32 @@
 """Configuration loading and validation."""
 
+import functools
 import json
 import logging
+import os
 import sys
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-logger = logging.getLogger(__name__)
+import fastjsonschema
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; config files fall back to json
+    orjson = None
 
-DEFAULT_CONFIG_PATH = None  # Resolved lazily
+logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
 def get_default_config_path() -> str:
-    """Resolve config path, checking multiple locations for bundled apps."""
+    """
+    Resolve config path, checking multiple locations for bundled apps.
+
+    Resolved once per process, so the file checks (and a bundled app's
+    first-run copy of its default config) happen on the first call only.
+    """
     config_name = "bot_config.json"
 
     if getattr(sys, "frozen", False):
@@ -35,10 +47,96 @@ def get_default_config_path() -> str:
         return str(Path(".") / config_name)
 
 
-DEFAULT_CONFIG_PATH = ""
+DEFAULT_CONFIG_PATH = get_default_config_path()
+
+# Parsed config files by absolute path, with the (mtime_ns, size) of the
+# file they were read from; BotConfig.from_file skips re-reading and
+# re-parsing a file while it is unchanged
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+_NUMBER = {"type": "number"}
+_INTEGER = {"type": "integer"}
+_BOOLEAN = {"type": "boolean"}
+_STRING = {"type": "string"}
+
+# Shape of a raw config, checked before any dataclass is built. Types only:
+# a half-filled config (no username yet, say) still loads, and the checks
+# the GUI reports to the user stay in BotConfig.validate
+CONFIG_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "username": _STRING,
+        "password": _STRING,
+        "game_url": _STRING,
+        # from_dict runs max_loss through float(), which takes numeric strings
+        "max_loss": {"type": ["number", "string"]},
+        "import_recent_on_new_session": _BOOLEAN,
+        "strategies": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "name": _STRING,
+                    "base_bet": _NUMBER,
+                    "auto_cashout": _NUMBER,
+                    "trigger_threshold": _NUMBER,
+                    "trigger_count": _INTEGER,
+                    "max_consecutive_losses": _INTEGER,
+                    "bet_multiplier": _NUMBER,
+                    "enabled": _BOOLEAN,
+                },
+                "required": [
+                    "name",
+                    "base_bet",
+                    "auto_cashout",
+                    "trigger_threshold",
+                    "trigger_count",
+                ],
+                "additionalProperties": False,
+            },
+        },
+        "custom_strategy": {
+            "type": "object",
+            "properties": {
+                "base_bet": _NUMBER,
+                "auto_cashout": _NUMBER,
+                "max_consecutive_losses": _INTEGER,
+                "max_losses_in_window": _INTEGER,
+                "loss_check_window": _INTEGER,
+                "bet_multiplier": _NUMBER,
+                "stop_profit_count": _INTEGER,
+                "cooldown_after_win": _INTEGER,
+                "cooldown_after_loss": _INTEGER,
+                "enabled": _BOOLEAN,
+                "activate_on_strong_hotstreak": _BOOLEAN,
+                "activate_on_weak_hotstreak": _BOOLEAN,
+                "activate_on_rule_of_17": _BOOLEAN,
+                "activate_on_pre_streak_pattern": _BOOLEAN,
+                "activate_on_possible_chain": _BOOLEAN,
+                "activate_on_high_deviation_10": _BOOLEAN,
+                "activate_on_high_deviation_15": _BOOLEAN,
+                "signal_confirm_threshold": _NUMBER,
+                "signal_confirm_count": _INTEGER,
+                "signal_confirm_window": _INTEGER,
+                "signal_monitor_rounds": _INTEGER,
+            },
+            "additionalProperties": False,
+        },
+    },
+}
+
+# CONFIG_SCHEMA compiled once into a plain Python function; it raises
+# fastjsonschema.JsonSchemaValueException, a ValueError
+_check_raw_config = fastjsonschema.compile(CONFIG_SCHEMA)
 
 
-@dataclass
+def _fields_dict(obj) -> Dict[str, Any]:
+    """A config dataclass's fields as a plain dict, in declaration order."""
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
+
+
+@dataclass(slots=True)
 class PrimaryStrategyConfig:
     name: str
     base_bet: float
@@ -49,8 +147,14 @@ class PrimaryStrategyConfig:
     bet_multiplier: float = 2.0
     enabled: bool = True
 
+    def __post_init__(self):
+        # A handful of names label every state, log line and bet row;
+        # interned, they are one shared object each
+        if isinstance(self.name, str):
+            self.name = sys.intern(self.name)
 
-@dataclass
+
+@dataclass(slots=True)
 class CustomStrategyConfig:
     base_bet: float = 1000
     auto_cashout: float = 2.0
@@ -77,7 +181,7 @@ class CustomStrategyConfig:
     signal_monitor_rounds: int = 20
 
 
-@dataclass
+@dataclass(slots=True)
 class BotConfig:
     username: str = ""
     password: str = ""
@@ -89,19 +193,38 @@ class BotConfig:
 
     @classmethod
     def from_file(cls, path: str = DEFAULT_CONFIG_PATH) -> "BotConfig":
-        with open(path, "r") as f:
-            raw = json.load(f)
-        return cls.from_dict(raw)
+        # Only the raw dict is cached: from_dict reads it without changing
+        # it, and every call builds fresh dataclasses the caller can modify
+        key = os.path.abspath(path)
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _CONFIG_CACHE.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cls.from_dict(cached[1])
+
+        if orjson is not None:
+            with open(path, "rb") as f:
+                raw = orjson.loads(f.read())
+        else:
+            with open(path, "r") as f:
+                raw = json.load(f)
+        cfg = cls.from_dict(raw)
+        _CONFIG_CACHE[key] = (stamp, raw)
+        return cfg
+
+    @classmethod
+    def clear_cache(cls):
+        """Forget every config from_file has parsed."""
+        _CONFIG_CACHE.clear()
 
     @classmethod
     def from_dict(cls, raw: Dict[str, Any]) -> "BotConfig":
+        _check_raw_config(raw)
         strategies = [PrimaryStrategyConfig(**s) for s in raw.get("strategies", [])]
 
         custom = None
         if "custom_strategy" in raw and raw["custom_strategy"].get("enabled"):
-            cst = raw["custom_strategy"].copy()
-            cst.pop("enabled", None)
-            custom = CustomStrategyConfig(**cst, enabled=True)
+            custom = CustomStrategyConfig(**{**raw["custom_strategy"], "enabled": True})
 
         return cls(
             username=raw.get("username", ""),
@@ -114,71 +237,42 @@ class BotConfig:
         )
 
     def to_dict(self) -> Dict[str, Any]:
-        result = {
-            "username": self.username,
-            "password": self.password,
-            "game_url": self.game_url,
-            "max_loss": self.max_loss,
-            "import_recent_on_new_session": self.import_recent_on_new_session,
-            "strategies": [],
-        }
-        for s in self.strategies:
-            result["strategies"].append(
-                {
-                    "name": s.name,
-                    "base_bet": s.base_bet,
-                    "auto_cashout": s.auto_cashout,
-                    "trigger_threshold": s.trigger_threshold,
-                    "trigger_count": s.trigger_count,
-                    "max_consecutive_losses": s.max_consecutive_losses,
-                    "bet_multiplier": s.bet_multiplier,
-                    "enabled": s.enabled,
-                }
-            )
+        result = _fields_dict(self)
+        result["strategies"] = [_fields_dict(s) for s in self.strategies]
         if self.custom_strategy:
-            cs = self.custom_strategy
-            result["custom_strategy"] = {
-                "base_bet": cs.base_bet,
-                "auto_cashout": cs.auto_cashout,
-                "max_consecutive_losses": cs.max_consecutive_losses,
-                "max_losses_in_window": cs.max_losses_in_window,
-                "loss_check_window": cs.loss_check_window,
-                "bet_multiplier": cs.bet_multiplier,
-                "stop_profit_count": cs.stop_profit_count,
-                "cooldown_after_win": cs.cooldown_after_win,
-                "cooldown_after_loss": cs.cooldown_after_loss,
-                "enabled": cs.enabled,
-                "activate_on_strong_hotstreak": cs.activate_on_strong_hotstreak,
-                "activate_on_weak_hotstreak": cs.activate_on_weak_hotstreak,
-                "activate_on_rule_of_17": cs.activate_on_rule_of_17,
-                "activate_on_pre_streak_pattern": cs.activate_on_pre_streak_pattern,
-                "activate_on_possible_chain": cs.activate_on_possible_chain,
-                "activate_on_high_deviation_10": cs.activate_on_high_deviation_10,
-                "activate_on_high_deviation_15": cs.activate_on_high_deviation_15,
-                "signal_confirm_threshold": cs.signal_confirm_threshold,
-                "signal_confirm_count": cs.signal_confirm_count,
-                "signal_confirm_window": cs.signal_confirm_window,
-                "signal_monitor_rounds": cs.signal_monitor_rounds,
-            }
+            result["custom_strategy"] = _fields_dict(self.custom_strategy)
+        else:
+            del result["custom_strategy"]
         return result
 
     def save(self, path: str = DEFAULT_CONFIG_PATH):
-        with open(path, "w") as f:
-            json.dump(self.to_dict(), f, indent=2)
+        if orjson is not None:
+            with open(path, "wb") as f:
+                f.write(orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2))
+        else:
+            with open(path, "w") as f:
+                json.dump(self.to_dict(), f, indent=2)
 
     def validate(self) -> List[str]:
-        errors = []
-        if not self.username:
-            errors.append("Username is required")
-        if not self.password:
-            errors.append("Password is required")
-        if not self.game_url:
-            errors.append("Game URL is required")
-        if not self.strategies:
-            errors.append("At least one primary strategy is required")
-        for s in self.strategies:
-            if s.base_bet <= 0:
-                errors.append(f"[{s.name}] Base bet must be positive")
-            if s.auto_cashout <= 1.0:
-                errors.append(f"[{s.name}] Auto cashout must be > 1.0")
+        errors = [msg for attr, msg in _REQUIRED_FIELDS if not getattr(self, attr)]
+        errors += [
+            f"[{s.name}] {msg}"
+            for s in self.strategies
+            for is_invalid, msg in _STRATEGY_CHECKS
+            if is_invalid(s)
+        ]
         return errors
+
+
+# BotConfig.validate's checks, in the order their errors are reported:
+# fields that must be set, then each strategy's own checks
+_REQUIRED_FIELDS = (
+    ("username", "Username is required"),
+    ("password", "Password is required"),
+    ("game_url", "Game URL is required"),
+    ("strategies", "At least one primary strategy is required"),
+)
+_STRATEGY_CHECKS = (
+    (lambda s: s.base_bet <= 0, "Base bet must be positive"),
+    (lambda s: s.auto_cashout <= 1.0, "Auto cashout must be > 1.0"),
+)
@@ -3,7 +3,10 @@
 import logging
 import sqlite3
 import sys
-from datetime import datetime, timedelta
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from operator import itemgetter
 from pathlib import Path
 from typing import List, Optional, Tuple
 
@@ -22,66 +25,175 @@ def get_db_path() -> str:
 
 DB_PATH = get_db_path()
 
+# Round and bet rows are buffered and written together once this many are
+# pending or this many seconds have passed since the last write
+WRITE_BATCH_ROWS = 16
+WRITE_BATCH_SECONDS = 1.0
+
+
+# Connection settings and tables, run as one script when a Database opens.
+# Times are stored as "YYYY-MM-DD HH:MM:SS[.ffffff]" TEXT, which sorts
+# chronologically and needs no sqlite3 adapter or converter.
+# WAL with synchronous=NORMAL syncs at checkpoints instead of on every
+# per-round commit; a crash can lose only the last few rounds, which are
+# re-imported from the game's history anyway
+_SCHEMA = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=134217728;  -- 128 MB
+PRAGMA cache_size=-20000;  -- ~20 MB
+
+BEGIN;
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    start_timestamp TEXT NOT NULL,
+    end_timestamp TEXT,
+    start_balance REAL,
+    end_balance REAL,
+    total_rounds INTEGER DEFAULT 0,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS multipliers (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    multiplier REAL NOT NULL,
+    bettor_count INTEGER,
+    timestamp TEXT DEFAULT CURRENT_TIMESTAMP,
+    session_id INTEGER REFERENCES sessions(id)
+);
+CREATE TABLE IF NOT EXISTS bets (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    strategy_name TEXT,
+    bet_amount REAL NOT NULL,
+    outcome TEXT CHECK(outcome IN ('win', 'loss')),
+    multiplier REAL,
+    profit_loss REAL,
+    timestamp TEXT DEFAULT CURRENT_TIMESTAMP
+);
+COMMIT;
+"""
+
+# PRAGMA user_version from which _migrate_orphan_multipliers has already run
+_ORPHANS_MIGRATED_VERSION = 1
+
+# Statements run on every call, prepared once per connection through
+# sqlite3's statement cache
+# Session times are local, as the UI shows them; SQLite stamps them itself
+_SQL_INSERT_SESSION = (
+    "INSERT INTO sessions (start_timestamp, start_balance) "
+    "VALUES (datetime('now', 'localtime'), ?)"
+)
+_SQL_END_SESSION = (
+    "UPDATE sessions SET end_timestamp = datetime('now', 'localtime'), "
+    "end_balance = ? WHERE id = ?"
+)
+_SQL_LAST_SESSION = """
+    SELECT s.id, MAX(m.timestamp), COUNT(m.id)
+    FROM sessions s
+    LEFT JOIN multipliers m ON s.id = m.session_id
+    GROUP BY s.id ORDER BY s.id DESC LIMIT 1
+"""
+_SQL_COUNT_SESSIONS = "SELECT COUNT(*) FROM sessions"
+_SQL_COUNT_ORPHANS = (
+    "SELECT COUNT(*), MAX(timestamp) FROM multipliers WHERE session_id IS NULL"
+)
+_SQL_INSERT_ORPHAN_SESSION = """
+    INSERT INTO sessions (start_timestamp, end_timestamp)
+    VALUES (
+        (SELECT MIN(timestamp) FROM multipliers WHERE session_id IS NULL),
+        (SELECT MAX(timestamp) FROM multipliers WHERE session_id IS NULL)
+    )
+"""
+_SQL_ADOPT_ORPHANS = "UPDATE multipliers SET session_id = ? WHERE session_id IS NULL"
+_SQL_LIST_SESSIONS = """
+    SELECT s.id, s.start_timestamp, s.end_timestamp, COUNT(m.id)
+    FROM sessions s
+    LEFT JOIN multipliers m ON s.id = m.session_id
+    GROUP BY s.id
+    ORDER BY s.id DESC
+"""
+_SQL_SESSION_MULTIPLIERS = (
+    "SELECT multiplier FROM multipliers WHERE session_id = ? ORDER BY id ASC"
+)
+_SQL_LAST_SESSION_MULTIPLIERS = """
+    SELECT multiplier FROM (
+        SELECT multiplier, id FROM multipliers
+        WHERE session_id = ? ORDER BY id DESC LIMIT ?
+    ) ORDER BY id ASC
+"""
+_SQL_INSERT_MISSING_ROUND = "INSERT OR IGNORE INTO multipliers (multiplier, session_id, timestamp) VALUES (?, ?, ?)"
+_SQL_INSERT_MULTIPLIER = "INSERT INTO multipliers (multiplier, bettor_count, session_id, timestamp) VALUES (?, ?, ?, ?)"
+_SQL_INSERT_BET = "INSERT INTO bets (strategy_name, bet_amount, outcome, multiplier, profit_loss, timestamp) VALUES (?, ?, ?, ?, ?, ?)"
+
+
+def _utc_timestamp() -> str:
+    """Now, in the format and timezone SQLite's CURRENT_TIMESTAMP uses."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
 
 class Database:
-    """SQLite database for round and bet history."""
+    """
+    SQLite database for round and bet history.
+
+    Every method shares one cursor, so an instance must only be used by one
+    thread at a time (the engine owns its own; the UI opens short-lived ones).
+    """
 
     def __init__(self, db_path: str = DB_PATH):
-        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        # Autocommit: writes that belong together run in _transaction
+        self.conn = sqlite3.connect(
+            db_path,
+            check_same_thread=False,
+            cached_statements=256,
+            isolation_level=None,
+        )
+        self._cur = self.conn.cursor()
         self._init_tables()
         self.current_session_id: Optional[int] = None
+        # Rows not yet written, stamped when they were added
+        self._pending_mults: List[tuple] = []
+        self._pending_bets: List[tuple] = []
+        self._last_flush = time.monotonic()
+
+    @contextmanager
+    def _transaction(self):
+        """BEGIN/COMMIT around the block, ROLLBACK if it or the COMMIT raises."""
+        self._cur.execute("BEGIN")
+        try:
+            yield self._cur
+            self._cur.execute("COMMIT")
+        except BaseException:
+            # SQLite may already have rolled back on its own
+            if self.conn.in_transaction:
+                self._cur.execute("ROLLBACK")
+            raise
 
     def _init_tables(self):
-        cur = self.conn.cursor()
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS sessions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                start_timestamp DATETIME NOT NULL,
-                end_timestamp DATETIME,
-                start_balance REAL,
-                end_balance REAL,
-                total_rounds INTEGER DEFAULT 0,
-                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS multipliers (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                multiplier REAL NOT NULL,
-                bettor_count INTEGER,
-                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                session_id INTEGER REFERENCES sessions(id)
-            )
-        """)
-        cur.execute("""
-            CREATE TABLE IF NOT EXISTS bets (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                strategy_name TEXT,
-                bet_amount REAL NOT NULL,
-                outcome TEXT CHECK(outcome IN ('win', 'loss')),
-                multiplier REAL,
-                profit_loss REAL,
-                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
-        # Ensure session_id column exists on multipliers (migration)
-        cur.execute("PRAGMA table_info(multipliers)")
-        columns = [col[1] for col in cur.fetchall()]
-        if "session_id" not in columns:
-            cur.execute(
-                "ALTER TABLE multipliers ADD COLUMN session_id INTEGER REFERENCES sessions(id)"
-            )
-        self.conn.commit()
+        cur = self._cur
+        self.conn.executescript(_SCHEMA)
+        cur.execute("PRAGMA user_version")
+        self._orphans_migrated = cur.fetchone()[0] >= _ORPHANS_MIGRATED_VERSION
+        # Ensure session_id column exists on multipliers (migration); a
+        # database the orphan migration has run on already has it
+        if not self._orphans_migrated:
+            cur.execute("PRAGMA table_info(multipliers)")
+            columns = [col[1] for col in cur.fetchall()]
+            if "session_id" not in columns:
+                cur.execute(
+                    "ALTER TABLE multipliers ADD COLUMN session_id INTEGER REFERENCES sessions(id)"
+                )
+        # Every multiplier read filters by session_id and orders by id
+        cur.execute(
+            "CREATE INDEX IF NOT EXISTS idx_multipliers_session_id "
+            "ON multipliers(session_id, id DESC)"
+        )
+        cur.execute("PRAGMA optimize")
 
     # ── Session management ──────────────────────────────────────────
 
     def create_session(self, start_balance: Optional[float] = None) -> int:
-        cur = self.conn.cursor()
-        cur.execute(
-            "INSERT INTO sessions (start_timestamp, start_balance) VALUES (?, ?)",
-            (datetime.now(), start_balance),
-        )
-        self.conn.commit()
+        cur = self._cur
+        cur.execute(_SQL_INSERT_SESSION, (start_balance,))
         session_id = cur.lastrowid
         self.current_session_id = session_id
         return session_id
@@ -89,82 +201,62 @@ class Database:
     def end_session(self, end_balance: Optional[float] = None):
         if self.current_session_id is None:
             return
-        cur = self.conn.cursor()
-        cur.execute(
-            "UPDATE sessions SET end_timestamp = ?, end_balance = ? WHERE id = ?",
-            (datetime.now(), end_balance, self.current_session_id),
-        )
-        self.conn.commit()
+        self.flush()
+        cur = self._cur
+        cur.execute(_SQL_END_SESSION, (end_balance, self.current_session_id))
 
     def get_last_session(self) -> Optional[Tuple[int, str, int]]:
         """Returns (session_id, last_timestamp, round_count) or None."""
-        cur = self.conn.cursor()
+        self.flush()
+        cur = self._cur
         self._migrate_orphan_multipliers(cur)
 
-        cur.execute("""
-            SELECT s.id, MAX(m.timestamp), COUNT(m.id)
-            FROM sessions s
-            LEFT JOIN multipliers m ON s.id = m.session_id
-            GROUP BY s.id ORDER BY s.id DESC LIMIT 1
-        """)
+        cur.execute(_SQL_LAST_SESSION)
         row = cur.fetchone()
         return row if row and row[1] else None
 
     def _migrate_orphan_multipliers(self, cur: sqlite3.Cursor):
-        """Assign orphan multipliers (no session_id) to a new session."""
-        cur.execute("SELECT COUNT(*) FROM sessions")
-        if cur.fetchone()[0] > 0:
-            return
-        cur.execute(
-            "SELECT COUNT(*), MAX(timestamp) FROM multipliers WHERE session_id IS NULL"
-        )
-        count, _ = cur.fetchone()
-        if not count or count == 0:
+        """
+        Assign orphan multipliers (no session_id) to a new session.
+
+        Runs once per database: every multiplier written since has a
+        session, so the outcome is recorded in user_version and later
+        calls return straight away.
+        """
+        if self._orphans_migrated:
             return
-        logger.info("Migrating %d orphan multipliers...", count)
-        cur.execute("""
-            INSERT INTO sessions (start_timestamp, end_timestamp)
-            VALUES (
-                (SELECT MIN(timestamp) FROM multipliers WHERE session_id IS NULL),
-                (SELECT MAX(timestamp) FROM multipliers WHERE session_id IS NULL)
-            )
-        """)
-        new_id = cur.lastrowid
-        cur.execute(
-            "UPDATE multipliers SET session_id = ? WHERE session_id IS NULL",
-            (new_id,),
-        )
-        self.conn.commit()
+        with self._transaction():
+            cur.execute(_SQL_COUNT_SESSIONS)
+            if cur.fetchone()[0] == 0:
+                cur.execute(_SQL_COUNT_ORPHANS)
+                count, _ = cur.fetchone()
+                if count:
+                    logger.info("Migrating %d orphan multipliers...", count)
+                    cur.execute(_SQL_INSERT_ORPHAN_SESSION)
+                    cur.execute(_SQL_ADOPT_ORPHANS, (cur.lastrowid,))
+            cur.execute(f"PRAGMA user_version = {_ORPHANS_MIGRATED_VERSION}")
+        self._orphans_migrated = True
 
     def list_sessions(self) -> List[Tuple[int, str, str, int]]:
         """Return all sessions as (id, start_timestamp, end_timestamp, round_count)."""
-        cur = self.conn.cursor()
-        cur.execute("""
-            SELECT s.id, s.start_timestamp, s.end_timestamp, COUNT(m.id)
-            FROM sessions s
-            LEFT JOIN multipliers m ON s.id = m.session_id
-            GROUP BY s.id
-            ORDER BY s.id DESC
-        """)
+        self.flush()
+        cur = self._cur
+        cur.execute(_SQL_LIST_SESSIONS)
         return cur.fetchall()
 
     def get_all_session_multipliers(self, session_id: int) -> List[float]:
         """Get ALL multipliers for a session (chronological order)."""
-        cur = self.conn.cursor()
-        cur.execute(
-            "SELECT multiplier FROM multipliers WHERE session_id = ? ORDER BY id ASC",
-            (session_id,),
-        )
-        return [row[0] for row in cur.fetchall()]
+        self.flush()
+        cur = self._cur
+        cur.execute(_SQL_SESSION_MULTIPLIERS, (session_id,))
+        return list(map(itemgetter(0), cur))
 
     def get_session_multipliers(self, session_id: int, n: int) -> List[float]:
         """Get last N multipliers from a session (chronological order)."""
-        cur = self.conn.cursor()
-        cur.execute(
-            "SELECT multiplier FROM multipliers WHERE session_id = ? ORDER BY id DESC LIMIT ?",
-            (session_id, n),
-        )
-        return [row[0] for row in reversed(cur.fetchall())]
+        self.flush()
+        cur = self._cur
+        cur.execute(_SQL_LAST_SESSION_MULTIPLIERS, (session_id, n))
+        return list(map(itemgetter(0), cur))
 
     def add_missing_rounds(
         self,
@@ -175,46 +267,50 @@ class Database:
     ):
         if not multipliers:
             return
-        cur = self.conn.cursor()
+        self.flush()
+        cur = self._cur
         total_sec = (end_time - start_time).total_seconds()
         sec_per = total_sec / max(len(multipliers) - 1, 1)
 
-        for i, mult in enumerate(multipliers):
-            ts = (
-                end_time
-                if i == len(multipliers) - 1
-                else start_time + timedelta(seconds=sec_per * (i + 1))
+        last = len(multipliers) - 1
+        rows = (
+            (
+                mult,
+                session_id,
+                (
+                    end_time
+                    if i == last
+                    else start_time + timedelta(seconds=sec_per * (i + 1))
+                ).isoformat(" "),
             )
-            try:
-                cur.execute(
-                    "INSERT INTO multipliers (multiplier, session_id, timestamp) VALUES (?, ?, ?)",
-                    (mult, session_id, ts),
-                )
-            except sqlite3.IntegrityError:
-                pass
-        self.conn.commit()
+            for i, mult in enumerate(multipliers)
+        )
+        # OR IGNORE skips rows that violate a constraint, one at a time,
+        # as catching IntegrityError per row did
+        with self._transaction():
+            cur.executemany(_SQL_INSERT_MISSING_ROUND, rows)
 
     # ── Round data ──────────────────────────────────────────────────
 
     def add_multiplier(self, multiplier: float, bettor_count: Optional[int] = None):
         if self.current_session_id is None:
             raise ValueError("No active session")
-        cur = self.conn.cursor()
-        cur.execute(
-            "INSERT INTO multipliers (multiplier, bettor_count, session_id) VALUES (?, ?, ?)",
-            (multiplier, bettor_count, self.current_session_id),
+        self._pending_mults.append(
+            (multiplier, bettor_count, self.current_session_id, _utc_timestamp())
         )
-        self.conn.commit()
+        self._maybe_flush()
 
     def get_recent_multipliers(self, count: int) -> List[float]:
         if self.current_session_id is None:
             return []
-        cur = self.conn.cursor()
-        cur.execute(
-            "SELECT multiplier FROM multipliers WHERE session_id = ? ORDER BY id DESC LIMIT ?",
-            (self.current_session_id, count),
-        )
-        return [row[0] for row in reversed(cur.fetchall())]
+        cur = self._cur
+        cur.execute(_SQL_LAST_SESSION_MULTIPLIERS, (self.current_session_id, count))
+        # Rounds still waiting to be written are the most recent ones
+        recent = list(map(itemgetter(0), cur))
+        recent += [
+            row[0] for row in self._pending_mults if row[2] == self.current_session_id
+        ]
+        return recent[max(len(recent) - count, 0) :]
 
     # ── Bets ────────────────────────────────────────────────────────
 
@@ -226,12 +322,60 @@ class Database:
         multiplier: float,
         profit_loss: float,
     ):
-        cur = self.conn.cursor()
-        cur.execute(
-            "INSERT INTO bets (strategy_name, bet_amount, outcome, multiplier, profit_loss) VALUES (?, ?, ?, ?, ?)",
-            (strategy_name, bet_amount, outcome, multiplier, profit_loss),
+        self._pending_bets.append(
+            (
+                strategy_name,
+                bet_amount,
+                outcome,
+                multiplier,
+                profit_loss,
+                _utc_timestamp(),
+            )
         )
-        self.conn.commit()
+        self._maybe_flush()
+
+    # ── Write batching ──────────────────────────────────────────────
+
+    def _maybe_flush(self):
+        pending = len(self._pending_mults) + len(self._pending_bets)
+        if (
+            pending >= WRITE_BATCH_ROWS
+            or time.monotonic() - self._last_flush >= WRITE_BATCH_SECONDS
+        ):
+            self.flush()
+
+    def flush(self):
+        """Write every buffered round and bet in one transaction.
+
+        A row that violates a constraint fails the whole batch, so the batch
+        is then written row by row and only that row is dropped.  Any other
+        error leaves the rows buffered for the next flush.
+        """
+        self._last_flush = time.monotonic()
+        if not self._pending_mults and not self._pending_bets:
+            return
+        mults, bets = self._pending_mults, self._pending_bets
+        try:
+            with self._transaction() as cur:
+                cur.executemany(_SQL_INSERT_MULTIPLIER, mults)
+                cur.executemany(_SQL_INSERT_BET, bets)
+        except sqlite3.IntegrityError:
+            self._insert_rows_singly(mults, bets)
+        self._pending_mults = []
+        self._pending_bets = []
+
+    def _insert_rows_singly(self, mults: List[tuple], bets: List[tuple]):
+        with self._transaction() as cur:
+            for sql, rows in (
+                (_SQL_INSERT_MULTIPLIER, mults),
+                (_SQL_INSERT_BET, bets),
+            ):
+                for row in rows:
+                    try:
+                        cur.execute(sql, row)
+                    except sqlite3.IntegrityError as e:
+                        logger.error("Dropped row %r: %s", row, e)
 
     def close(self):
+        self.flush()
         self.conn.close()
@@ -679,7 +679,11 @@ class BotEngine:
             logger.warning("[Custom] Cannot activate – another strategy is active")
 
     def _hot_reload(self, raw_config: dict):
-        new_cfg = BotConfig.from_dict(raw_config)
+        try:
+            new_cfg = BotConfig.from_dict(raw_config)
+        except (TypeError, ValueError) as e:
+            logger.error("Config hot-reload rejected, keeping current config: %s", e)
+            return
         self.config = new_cfg
         self._load_strategies()
         logger.info("Config hot-reloaded")
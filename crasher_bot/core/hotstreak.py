@@ -1,7 +1,9 @@
 """Hotstreak detection and pattern analysis."""
 
 import logging
-from typing import List, Optional
+from collections import deque
+from itertools import islice
+from typing import Deque, List, Optional
 
 import numpy as np
 
@@ -20,7 +22,8 @@ class HotstreakTracker:
     """Detects hotstreaks and cold streaks in multiplier history."""
 
     def __init__(self):
-        self.recent: List[float] = []
+        # Bounded, so old rounds drop off the left without shifting the rest
+        self.recent: Deque[float] = deque(maxlen=HISTORY_SIZE)
         self.current_hotstreak: Optional[dict] = None
         self.last_hotstreak: Optional[dict] = None
         self.hotstreak_end_round = 0
@@ -33,15 +36,15 @@ class HotstreakTracker:
     def add_multiplier(self, multiplier: float):
         self.current_round += 1
         self.recent.append(multiplier)
-        if len(self.recent) > HISTORY_SIZE:
-            self.recent.pop(0)
         self._detect_hotstreak()
         self._track_cold(multiplier)
 
     # ── Queries ─────────────────────────────────────────────────────
 
     def get_last_n(self, n: int) -> List[float]:
-        return self.recent[-n:] if len(self.recent) >= n else []
+        if len(self.recent) < n:
+            return []
+        return list(islice(self.recent, len(self.recent) - n, None))
 
     def in_hotstreak(self) -> bool:
         return self.current_hotstreak is not None
@@ -58,7 +61,7 @@ class HotstreakTracker:
         for ws in range(HOTSTREAK_MAX_WINDOW, HOTSTREAK_MIN_WINDOW - 1, -1):
             if len(self.recent) < ws:
                 continue
-            window = self.recent[-ws:]
+            window = self.get_last_n(ws)
             above = sum(1 for m in window if m >= 2.0)
             pct = above / ws
             if pct >= HOTSTREAK_WEAK_PCT:
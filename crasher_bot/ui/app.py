@@ -635,7 +635,11 @@ class Application:
             return
         self.config["username"] = self._username_entry.get().strip()
         self.config["password"] = self._password_entry.get().strip()
-        cfg = BotConfig.from_dict(self.config)
+        try:
+            cfg = BotConfig.from_dict(self.config)
+        except (TypeError, ValueError) as e:
+            messagebox.showerror("Config Error", str(e))
+            return
         errors = cfg.validate()
         if errors:
             messagebox.showerror("Config Error", "\n".join(errors))
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Prime the numba cache for the backtest simulator.
+
+Importing analysis/custom/backtest_simulator.py compiles its simulation kernel
+and writes it to __pycache__, so later runs (and grid-search workers) load it
+instead of compiling.  Run once after installing or upgrading numba, e.g. when
+building an image.
+
+It then runs a few configs through both the kernel and the Python path on
+synthetic sessions and exits non-zero if they disagree.  The thresholds are
+not exactly representable as floats (1.3x, 2.1x) and many rounds land right
+on them, so a kernel that compares float32 rounds in the wrong precision
+shows up here.
+
+Usage:
+    python scripts/warmup_numba.py
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "analysis" / "custom"))
+
+import backtest_simulator  # noqa: E402
+
+# (auto_cashout, signal_confirm_threshold) pairs to cross-check
+CHECK_THRESHOLDS = [(1.3, 2.0), (2.1, 2.0), (2.0, 2.1), (1.7, 1.1)]
+CHECK_FIELDS = ("total_profit", "total_bets", "total_wins", "signals_fired")
+
+
+def synthetic_sessions(seed: int = 7):
+    """Sessions of crash-like rounds, rounded to cents like the real data."""
+    rng = np.random.default_rng(seed)
+    sessions = []
+    for sid, n in enumerate((300, 800, 1500)):
+        mults = np.round(np.clip(0.99 / (1 - rng.random(n)), 1.0, 500.0), 2)
+        sessions.append(
+            backtest_simulator.SessionData(
+                session_id=sid,
+                multipliers=mults.astype(np.float32),
+                start_time="",
+                end_time=None,
+            )
+        )
+    return sessions
+
+
+def check_kernel() -> bool:
+    """Compare the kernel with the Python path; True when they agree."""
+    engine = backtest_simulator.BacktestEngine(synthetic_sessions())
+    ok = True
+    for auto_cashout, confirm_threshold in CHECK_THRESHOLDS:
+        cfg = backtest_simulator.CustomConfig(
+            auto_cashout=auto_cashout, signal_confirm_threshold=confirm_threshold
+        )
+        engine.record_details = False
+        compiled = engine.run(cfg)
+        engine.record_details = True
+        python = engine.run(cfg)
+        for name in CHECK_FIELDS:
+            got, want = getattr(compiled, name), getattr(python, name)
+            if got != want:
+                print(
+                    f"MISMATCH auto_cashout={auto_cashout} "
+                    f"confirm={confirm_threshold}: {name} kernel={got} python={want}"
+                )
+                ok = False
+    return ok
+
+
+if backtest_simulator.njit is None:
+    print("numba is not installed; nothing to compile")
+else:
+    print("numba kernel compiled and cached")
+    if not check_kernel():
+        sys.exit(1)
+    print("numba kernel matches the Python path")